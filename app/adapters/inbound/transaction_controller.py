@@ -83,7 +83,7 @@ async def create_transaction(
             account_id=transaction_data.account_id,
             category_id=transaction_data.category_id,
             transaction_type=transaction_data.type,
-            amount=float(transaction_data.amount),
+            amount=transaction_data.amount,
             description=transaction_data.description,
             date=transaction_data.date,
             is_recurring=transaction_data.is_recurring,
@@ -313,11 +313,7 @@ async def update_transaction(
             account_id=transaction_data.account_id,
             category_id=transaction_data.category_id,
             transaction_type=transaction_data.type,
-            amount=(
-                float(transaction_data.amount)
-                if transaction_data.amount
-                else None
-            ),
+            amount=transaction_data.amount,
             description=transaction_data.description,
             date=transaction_data.date,
             is_recurring=transaction_data.is_recurring,
@@ -1,6 +1,8 @@
+import heapq
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from app.core.domain.account import Account
@@ -25,6 +27,9 @@ from app.core.ports.transaction import (
     TransactionRepository,
 )
 
+# Chave do índice mensal de transações: (user_id, ano, mês)
+MonthKey = Tuple[str, int, int]
+
 
 class InMemoryUserRepository(UserRepositoryPort):
     """Implementação in-memory do repositório de usuários."""
@@ -53,6 +58,11 @@ class InMemoryUserRepository(UserRepositoryPort):
 
         return user
 
+    def add_user(self, user: User) -> None:
+        """Insere um usuário já existente (ex.: restaurar dados de teste)."""
+        self._users[user.id] = user
+        self._users_by_email[user.email] = user.id
+
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Busca usuário por ID."""
         return self._users.get(user_id)
@@ -104,8 +114,8 @@ class InMemoryUserRepository(UserRepositoryPort):
 
     def clear(self) -> None:
         """Limpa todos os dados do repositório."""
-        self._users.clear()
-        self._users_by_email.clear()
+        self._users = {}
+        self._users_by_email = {}
 
 
 class InMemoryPasswordResetRepository(PasswordResetRepositoryPort):
@@ -182,7 +192,7 @@ class InMemoryPasswordResetRepository(PasswordResetRepositoryPort):
 
     def clear(self) -> None:
         """Limpa todos os dados do repositório."""
-        self._tokens.clear()
+        self._tokens = {}
 
 
 class InMemoryAccountRepository(AccountRepository):
@@ -213,6 +223,27 @@ class InMemoryAccountRepository(AccountRepository):
 
         return account
 
+    async def create_many(self, accounts: List[Account]) -> List[Account]:
+        """Cria várias contas de uma vez, com as mesmas regras de `create`."""
+        seen_names = set()
+        for account in accounts:
+            name_key = (str(account.user_id), account.name.lower())
+            if name_key in seen_names or await self.get_by_name_and_user(
+                account.name, account.user_id
+            ):
+                raise AccountAlreadyExistsError(
+                    account.name, str(account.user_id)
+                )
+            seen_names.add(name_key)
+
+        self._accounts.update((str(a.id), a) for a in accounts)
+        for account in accounts:
+            self._accounts_by_user.setdefault(str(account.user_id), []).append(
+                str(account.id)
+            )
+
+        return accounts
+
     async def get_by_id(
         self, account_id: UUID, user_id: UUID
     ) -> Optional[Account]:
@@ -303,8 +334,8 @@ class InMemoryAccountRepository(AccountRepository):
 
     def clear(self) -> None:
         """Limpa todos os dados do repositório."""
-        self._accounts.clear()
-        self._accounts_by_user.clear()
+        self._accounts = {}
+        self._accounts_by_user = {}
 
 
 class InMemoryTransactionRepository(TransactionRepository):
@@ -313,6 +344,26 @@ class InMemoryTransactionRepository(TransactionRepository):
     def __init__(self) -> None:
         self._transactions: Dict[str, Transaction] = {}
         self._transactions_by_user: Dict[str, List[str]] = {}
+        # Índice por (usuário, ano, mês) para consultas por período
+        self._transactions_by_month: Dict[MonthKey, List[str]] = {}
+        self._month_key_by_id: Dict[str, MonthKey] = {}
+
+    def _index_month(self, transaction: Transaction) -> None:
+        """Mantém o índice mensal, movendo a transação se a data mudou."""
+        transaction_id = str(transaction.id)
+        key = (
+            str(transaction.user_id),
+            transaction.date.year,
+            transaction.date.month,
+        )
+        old_key = self._month_key_by_id.get(transaction_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._transactions_by_month[old_key].remove(transaction_id)
+
+        self._transactions_by_month.setdefault(key, []).append(transaction_id)
+        self._month_key_by_id[transaction_id] = key
 
     async def create(self, transaction: Transaction) -> Transaction:
         """Cria uma nova transação no repositório."""
@@ -324,9 +375,27 @@ class InMemoryTransactionRepository(TransactionRepository):
         if user_id not in self._transactions_by_user:
             self._transactions_by_user[user_id] = []
         self._transactions_by_user[user_id].append(transaction_id)
+        self._index_month(transaction)
 
         return transaction
 
+    async def create_many(
+        self, transactions: List[Transaction]
+    ) -> List[Transaction]:
+        """Cria várias transações de uma vez.
+
+        Assim como `create`, não verifica duplicidade: transações não têm
+        chave natural única.
+        """
+        self._transactions.update((str(t.id), t) for t in transactions)
+        for transaction in transactions:
+            self._transactions_by_user.setdefault(
+                str(transaction.user_id), []
+            ).append(str(transaction.id))
+            self._index_month(transaction)
+
+        return transactions
+
     async def get_by_id(
         self, transaction_id: UUID, user_id: UUID
     ) -> Optional[Transaction]:
@@ -375,17 +444,19 @@ class InMemoryTransactionRepository(TransactionRepository):
 
             transactions.append(transaction)
 
-        # Ordenar por data (mais recentes primeiro)
-        transactions.sort(key=lambda t: t.date, reverse=True)
-
-        # Aplicar paginação
-        return transactions[offset: offset + limit]
+        # Selecionar só a página pedida, por data (mais recentes primeiro);
+        # o heap evita ordenar a lista inteira (mesma ordem que `sorted`)
+        page = heapq.nlargest(
+            offset + limit, transactions, key=attrgetter("date")
+        )
+        return page[offset:]
 
     async def update(self, transaction: Transaction) -> Transaction:
         """Atualiza uma transação existente."""
         transaction_id = str(transaction.id)
         transaction.updated_at = datetime.utcnow()
         self._transactions[transaction_id] = transaction
+        self._index_month(transaction)
         return transaction
 
     async def delete(self, transaction_id: UUID, user_id: UUID) -> bool:
@@ -397,6 +468,25 @@ class InMemoryTransactionRepository(TransactionRepository):
             return True
         return False
 
+    async def clone_with_date(
+        self,
+        transaction_id: UUID,
+        user_id: UUID,
+        new_date: datetime,
+        description_suffix: str = "",
+    ) -> Optional[Transaction]:
+        """Duplica transação com nova data em uma única operação."""
+        original = await self.get_by_id(transaction_id, user_id)
+        if not original:
+            return None
+
+        clone = original.duplicate(new_date)
+        if description_suffix:
+            clone.update_description(
+                f"{clone.description}{description_suffix}"
+            )
+        return await self.create(clone)
+
     async def count_by_user_id(self, user_id: UUID) -> int:
         """Conta total de transações ativas do usuário."""
         transactions = await self.get_by_user_id(user_id)
@@ -437,12 +527,25 @@ class InMemoryTransactionRepository(TransactionRepository):
         self, user_id: UUID, start_date: datetime, end_date: datetime
     ) -> List[Transaction]:
         """Busca transações do usuário em um período específico."""
-        return await self.get_by_user_id(
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date,
-            limit=1000,  # Limite alto para pegar todas do período
-        )
+        user_id_str = str(user_id)
+        transactions = []
+
+        # Percorre só os meses do período no índice mensal
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            for tx_id in self._transactions_by_month.get(
+                (user_id_str, year, month), ()
+            ):
+                transaction = self._transactions[tx_id]
+                if (
+                    transaction.is_active
+                    and start_date <= transaction.date <= end_date
+                ):
+                    transactions.append(transaction)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        # Limite alto para pegar todas do período (mais recentes primeiro)
+        return heapq.nlargest(1000, transactions, key=attrgetter("date"))
 
     async def get_recent_by_user(
         self, user_id: UUID, limit: int = 10
@@ -452,8 +555,10 @@ class InMemoryTransactionRepository(TransactionRepository):
 
     def clear(self) -> None:
         """Limpa todos os dados do repositório."""
-        self._transactions.clear()
-        self._transactions_by_user.clear()
+        self._transactions = {}
+        self._transactions_by_user = {}
+        self._transactions_by_month = {}
+        self._month_key_by_id = {}
 
 
 class InMemoryCategoryRepository(CategoryRepository):
@@ -477,6 +582,23 @@ class InMemoryCategoryRepository(CategoryRepository):
 
         return category
 
+    async def create_many(self, categories: List[Category]) -> List[Category]:
+        """Cria várias categorias de uma vez.
+
+        Assim como `create`, não verifica duplicidade: a unicidade de nome é
+        regra do CategoryService, que consulta o repositório antes de criar.
+        """
+        self._categories.update((str(c.id), c) for c in categories)
+        for category in categories:
+            user_id_str = (
+                str(category.user_id) if category.user_id else "system"
+            )
+            self._categories_by_user.setdefault(user_id_str, []).append(
+                str(category.id)
+            )
+
+        return categories
+
     async def get_by_id(
         self, category_id: UUID, user_id: Optional[UUID] = None
     ) -> Optional[Category]:
@@ -629,8 +751,8 @@ class InMemoryCategoryRepository(CategoryRepository):
 
     def clear(self) -> None:
         """Limpa todos os dados do repositório."""
-        self._categories.clear()
-        self._categories_by_user.clear()
+        self._categories = {}
+        self._categories_by_user = {}
         self._system_categories_initialized = False
 
 
@@ -707,8 +829,8 @@ class InMemoryGoalRepository(GoalRepository):
 
     def clear(self) -> None:
         """Limpa todos os dados do repositório."""
-        self._goals.clear()
-        self._goals_by_user.clear()
+        self._goals = {}
+        self._goals_by_user = {}
 
 
 class InMemoryBudgetRepository(BudgetRepository):
@@ -790,5 +912,5 @@ class InMemoryBudgetRepository(BudgetRepository):
 
     def clear(self) -> None:
         """Limpa todos os dados do repositório."""
-        self._budgets.clear()
-        self._budgets_by_user_month.clear()
+        self._budgets = {}
+        self._budgets_by_user_month = {}
@@ -1,15 +1,21 @@
+from typing import Optional
+
 import bcrypt
 
+from app.config.settings import get_settings
 from app.core.ports.auth import PasswordServicePort
 
 
 class BcryptPasswordService(PasswordServicePort):
     """Implementação do serviço de hashing de senhas com bcrypt."""
 
+    def __init__(self, rounds: Optional[int] = None):
+        self._rounds = rounds or get_settings().bcrypt_rounds
+
     def hash_password(self, password: str) -> str:
         """Gera hash da senha."""
         # Gera salt e hash da senha
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self._rounds)
         hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
         return hashed.decode("utf-8")
 
@@ -7,12 +7,18 @@ validação.
 """
 
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=32)
+def _parse_cors_origins(value: str) -> Tuple[str, ...]:
+    """Separa as origens CORS por vírgula, com cache por string."""
+    return tuple(filter(None, map(str.strip, value.split(","))))
+
+
 class Settings(BaseSettings):
     """
     Configurações da aplicação carregadas automaticamente do ambiente.
@@ -73,6 +79,13 @@ class Settings(BaseSettings):
         description="Tempo de expiração do token de acesso em minutos",
     )
 
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="Fator de custo (log2) do hashing de senhas com bcrypt",
+    )
+
     @property
     def access_token_expire_seconds(self) -> int:
         """Retorna o tempo de expiração do token em segundos."""
@@ -162,9 +175,7 @@ class Settings(BaseSettings):
     def parse_cors_origins(cls, v):
         """Parse das origens CORS se fornecidas como string."""
         if isinstance(v, str):
-            return [
-                origin.strip() for origin in v.split(",") if origin.strip()
-            ]
+            return list(_parse_cors_origins(v))
         elif isinstance(v, list):
             return v
         return v
@@ -1,4 +1,5 @@
-from typing import Optional
+from decimal import Decimal
+from typing import Optional, Union
 
 
 class FinAppException(Exception):
@@ -33,7 +34,7 @@ class InvalidBalanceError(FinAppException):
 
 
 class InvalidTransactionAmountError(FinAppException):
-    def __init__(self, amount: float):
+    def __init__(self, amount: Union[Decimal, float]):
         super().__init__(f"Invalid transaction amount: {amount}.")
 
 
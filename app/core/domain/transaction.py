@@ -13,6 +13,9 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+# Janela máxima para transações planejadas (datas futuras)
+_FUTURE_DATE_LIMIT = timedelta(days=30)
+
 
 class TransactionType(str, Enum):
     """Tipos de transação financeira."""
@@ -58,12 +61,10 @@ class Transaction(BaseModel):
         """Valida o valor da transação."""
         if v <= 0:
             raise ValueError("Valor deve ser positivo")
-        # Verifica se tem no máximo 2 casas decimais
-        str_value = str(v)
-        if "." in str_value:
-            decimal_places = len(str_value.split(".")[1])
-            if decimal_places > 2:
-                raise ValueError("Valor deve ter no máximo 2 casas decimais")
+        # Verifica se tem no máximo 2 casas decimais (sem formatar string)
+        exponent = v.as_tuple().exponent
+        if isinstance(exponent, int) and exponent < -2:
+            raise ValueError("Valor deve ter no máximo 2 casas decimais")
         return v
 
     @field_validator("description")
@@ -102,12 +103,8 @@ class Transaction(BaseModel):
     @classmethod
     def validate_date(cls, v: datetime) -> datetime:
         """Valida a data da transação."""
-        from datetime import datetime, timedelta
-
-        now = datetime.utcnow()
         # Permite até 30 dias no futuro para transações planejadas
-        future_limit = now + timedelta(days=30)
-        if v > future_limit:
+        if v > datetime.utcnow() + _FUTURE_DATE_LIMIT:
             raise ValueError(
                 "Data da transação não pode ser mais de 30 dias no futuro"
             )
@@ -133,9 +130,7 @@ class Transaction(BaseModel):
 
     def update_date(self, new_date: datetime) -> None:
         """Atualiza a data da transação."""
-        now = datetime.utcnow()
-        max_future_date = now + timedelta(days=30)
-        if new_date > max_future_date:
+        if new_date > datetime.utcnow() + _FUTURE_DATE_LIMIT:
             raise ValueError(
                 "Data da transação não pode ser mais de 30 dias no futuro"
             )
@@ -7,7 +7,8 @@ adaptadores para transações e categorias.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from decimal import Decimal
+from typing import List, Optional, Union
 from uuid import UUID
 
 from app.core.domain.transaction import Category, Transaction, TransactionType
@@ -48,6 +49,16 @@ class TransactionRepository(ABC):
     async def delete(self, transaction_id: UUID, user_id: UUID) -> bool:
         """Remove transação (soft delete)."""
 
+    @abstractmethod
+    async def clone_with_date(
+        self,
+        transaction_id: UUID,
+        user_id: UUID,
+        new_date: datetime,
+        description_suffix: str = "",
+    ) -> Optional[Transaction]:
+        """Duplica transação com nova data em uma única operação."""
+
     @abstractmethod
     async def count_by_user_id(self, user_id: UUID) -> int:
         """Conta total de transações ativas do usuário."""
@@ -120,7 +131,7 @@ class TransactionService(ABC):
         account_id: UUID,
         category_id: UUID,
         transaction_type: TransactionType,
-        amount: float,
+        amount: Union[Decimal, float],
         description: str,
         date: datetime,
         is_recurring: bool = False,
@@ -156,7 +167,7 @@ class TransactionService(ABC):
         account_id: Optional[UUID] = None,
         category_id: Optional[UUID] = None,
         transaction_type: Optional[TransactionType] = None,
-        amount: Optional[float] = None,
+        amount: Optional[Union[Decimal, float]] = None,
         description: Optional[str] = None,
         date: Optional[datetime] = None,
         is_recurring: Optional[bool] = None,
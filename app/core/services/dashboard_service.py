@@ -39,6 +39,15 @@ from app.core.ports.transaction import (
     TransactionRepository,
 )
 
+# Quantidade de pontos da evolução de saldo (um a cada 30 dias)
+_EVOLUTION_POINTS = 12
+
+# Variações fictícias de saldo, receita e despesa por ponto (constantes)
+_EVOLUTION_VARIATIONS = tuple(
+    (Decimal(i * 100), Decimal(i * 2000), Decimal(i * 1500))
+    for i in range(_EVOLUTION_POINTS)
+)
+
 
 class FinancialAnalyticsServiceImpl(FinancialAnalyticsServicePort):
     """Implementação do serviço de analytics financeiros."""
@@ -68,17 +77,17 @@ class FinancialAnalyticsServiceImpl(FinancialAnalyticsServicePort):
             if not transactions:
                 return 50  # Score neutro se não há transações
 
-            # Calcular receitas e despesas
-            total_income = sum(
-                t.amount
-                for t in transactions
-                if t.type == TransactionType.INCOME
-            )
-            total_expenses = sum(
-                t.amount
-                for t in transactions
-                if t.type == TransactionType.EXPENSE
-            )
+            # Calcular receitas, despesas e gastos diários em uma passada
+            total_income = Decimal("0")
+            total_expenses = Decimal("0")
+            daily_expenses: Dict = {}
+            for t in transactions:
+                if t.type == TransactionType.INCOME:
+                    total_income += t.amount
+                elif t.type == TransactionType.EXPENSE:
+                    total_expenses += t.amount
+                    day = t.date.date()
+                    daily_expenses[day] = daily_expenses.get(day, 0) + t.amount
 
             # Análise 1: Taxa de poupança (30 pontos)
             if total_income > 0:
@@ -94,14 +103,6 @@ class FinancialAnalyticsServiceImpl(FinancialAnalyticsServicePort):
 
             # Análise 2: Consistência de gastos (20 pontos)
             if len(transactions) >= 5:
-                daily_expenses = {}
-                for t in transactions:
-                    if t.type == TransactionType.EXPENSE:
-                        day = t.date.date()
-                        daily_expenses[day] = (
-                            daily_expenses.get(day, 0) + t.amount
-                        )
-
                 if daily_expenses:
                     expense_values = list(daily_expenses.values())
                     avg_expense = sum(expense_values) / len(expense_values)
@@ -346,26 +347,28 @@ class DashboardServiceImpl(DashboardServicePort):
             )
         )
 
-        # Calcular métricas básicas
-        income_transactions = [
-            t for t in transactions if t.type == TransactionType.INCOME
-        ]
-        expense_transactions = [
-            t for t in transactions if t.type == TransactionType.EXPENSE
-        ]
+        # Calcular totais, maiores valores e contagens em uma passada
+        total_income = Decimal("0")
+        total_expenses = Decimal("0")
+        highest_income = Decimal("0")
+        highest_expense = Decimal("0")
+        income_count = 0
+        expense_count = 0
+
+        for t in transactions:
+            if t.type == TransactionType.INCOME:
+                total_income += t.amount
+                income_count += 1
+                if income_count == 1 or t.amount > highest_income:
+                    highest_income = t.amount
+            elif t.type == TransactionType.EXPENSE:
+                total_expenses += t.amount
+                expense_count += 1
+                if expense_count == 1 or t.amount > highest_expense:
+                    highest_expense = t.amount
 
-        total_income = sum(t.amount for t in income_transactions)
-        total_expenses = sum(t.amount for t in expense_transactions)
         net_balance = total_income - total_expenses
 
-        # Métricas adicionais
-        highest_income = max(
-            (t.amount for t in income_transactions), default=Decimal("0")
-        )
-        highest_expense = max(
-            (t.amount for t in expense_transactions), default=Decimal("0")
-        )
-
         # Calcular médias diárias
         period_days = (
             period_filter.end_date - period_filter.start_date
@@ -388,8 +391,8 @@ class DashboardServiceImpl(DashboardServicePort):
             daily_average_income=daily_avg_income,
             daily_average_expenses=daily_avg_expenses,
             total_transactions=len(transactions),
-            income_transactions=len(income_transactions),
-            expense_transactions=len(expense_transactions),
+            income_transactions=income_count,
+            expense_transactions=expense_count,
         )
 
     async def get_dashboard_expenses_by_category(
@@ -413,16 +416,15 @@ class DashboardServiceImpl(DashboardServicePort):
             )
         )
 
-        expense_transactions = [
-            t for t in transactions if t.type == TransactionType.EXPENSE
-        ]
-        total_expenses = sum(t.amount for t in expense_transactions)
-
-        # Agrupar por categoria
+        # Somar e agrupar as despesas por categoria em uma passada
+        total_expenses = Decimal("0")
         category_expenses: Dict[UUID, Decimal] = {}
         category_counts: Dict[UUID, int] = {}
 
-        for transaction in expense_transactions:
+        for transaction in transactions:
+            if transaction.type != TransactionType.EXPENSE:
+                continue
+            total_expenses += transaction.amount
             cat_id = transaction.category_id
             category_expenses[cat_id] = (
                 category_expenses.get(cat_id, Decimal("0"))
@@ -503,18 +505,17 @@ class DashboardServiceImpl(DashboardServicePort):
         initial_balance = sum(account.balance for account in accounts)
 
         # Para demo, criar alguns pontos de dados básicos
-        for i in range(12):
-            point_date = current_date + timedelta(days=30 * i)
-            # Simulação simples - em produção seria baseado em transações
-            # históricas
-            balance_variation = Decimal(str(i * 100))  # Crescimento fictício
-
+        # Simulação simples - em produção seria baseado em transações
+        # históricas (crescimento fictício)
+        for i, (balance_variation, income, expenses) in enumerate(
+            _EVOLUTION_VARIATIONS
+        ):
             data_points.append(
                 BalancePoint(
-                    date=point_date,
+                    date=current_date + timedelta(days=30 * i),
                     balance=initial_balance + balance_variation,
-                    cumulative_income=Decimal(str(i * 2000)),
-                    cumulative_expenses=Decimal(str(i * 1500)),
+                    cumulative_income=income,
+                    cumulative_expenses=expenses,
                 )
             )
 
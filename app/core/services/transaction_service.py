@@ -5,9 +5,10 @@ Este módulo contém a lógica de negócio para gestão de transações
 e categorias financeiras.
 """
 
+import asyncio
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, List, Optional, Union
 from uuid import UUID
 
 from app.core.domain.exceptions import (
@@ -33,6 +34,40 @@ from app.core.ports.transaction import (
     TransactionService as TransactionServicePort,
 )
 
+# Mapeamento pré-computado valor -> enum (evita o lookup do Enum por chamada)
+_RECURRENCE_BY_VALUE = {member.value: member for member in RecurrenceType}
+
+
+def _resolve_recurrence(value: str) -> RecurrenceType:
+    """Converte a frequência informada em RecurrenceType."""
+    frequency = _RECURRENCE_BY_VALUE.get(value)
+    if frequency is None:
+        raise ValueError(f"Frequência inválida: {value}")
+    return frequency
+
+
+_CENTS = Decimal("0.01")
+
+
+async def _none() -> Any:
+    """Corrotina neutra para posições opcionais de asyncio.gather."""
+    return None
+
+
+def _to_money(value: Union[Decimal, int, float, str]) -> Decimal:
+    """Converte um valor monetário para Decimal com duas casas decimais."""
+    return Decimal(value).quantize(_CENTS)
+
+
+def _parse_amount(value: Union[Decimal, float]) -> Decimal:
+    """Converte o valor de uma transação, exigindo centavos inteiros."""
+    # float passa por str para não herdar o erro da representação binária
+    amount = Decimal(str(value) if isinstance(value, float) else value)
+    money = amount.quantize(_CENTS)
+    if money != amount or money <= 0:
+        raise InvalidTransactionAmountError(value)
+    return money
+
 
 class TransactionServiceImpl(TransactionServicePort):
     """Implementação do serviço de transações."""
@@ -53,7 +88,7 @@ class TransactionServiceImpl(TransactionServicePort):
         account_id: UUID,
         category_id: UUID,
         transaction_type: TransactionType,
-        amount: float,
+        amount: Union[Decimal, float],
         description: str,
         date: datetime,
         is_recurring: bool = False,
@@ -78,18 +113,12 @@ class TransactionServiceImpl(TransactionServicePort):
             )
 
         # Validar valor
-        if amount <= 0:
-            raise InvalidTransactionAmountError(amount)
+        money = _parse_amount(amount)
 
         # Converter frequência de string para enum se fornecida
         frequency_enum = None
         if recurrence_frequency:
-            try:
-                frequency_enum = RecurrenceType(recurrence_frequency)
-            except ValueError:
-                raise ValueError(
-                    f"Frequência inválida: {recurrence_frequency}"
-                )
+            frequency_enum = _resolve_recurrence(recurrence_frequency)
 
         # Criar transação
         transaction = Transaction(
@@ -97,7 +126,7 @@ class TransactionServiceImpl(TransactionServicePort):
             account_id=account_id,
             category_id=category_id,
             type=transaction_type,
-            amount=Decimal(str(amount)),
+            amount=money,
             description=description,
             date=date,
             is_recurring=is_recurring,
@@ -153,7 +182,7 @@ class TransactionServiceImpl(TransactionServicePort):
         account_id: Optional[UUID] = None,
         category_id: Optional[UUID] = None,
         transaction_type: Optional[TransactionType] = None,
-        amount: Optional[float] = None,
+        amount: Optional[Union[Decimal, float]] = None,
         description: Optional[str] = None,
         date: Optional[datetime] = None,
         is_recurring: Optional[bool] = None,
@@ -164,17 +193,30 @@ class TransactionServiceImpl(TransactionServicePort):
         transaction = await self.get_transaction_by_id(transaction_id, user_id)
         old_account_id = transaction.account_id
 
-        # Validar nova conta se fornecida
-        if account_id and account_id != transaction.account_id:
-            account = await self._account_repo.get_by_id(account_id, user_id)
-            if not account:
-                raise AccountNotFoundError(str(account_id), str(user_id))
+        # Validar nova conta e nova categoria em paralelo
+        new_account_id = (
+            account_id if account_id != transaction.account_id else None
+        )
+        new_category_id = (
+            category_id if category_id != transaction.category_id else None
+        )
+        account, category = await asyncio.gather(
+            (
+                self._account_repo.get_by_id(new_account_id, user_id)
+                if new_account_id
+                else _none()
+            ),
+            (
+                self._category_repo.get_by_id(new_category_id, user_id)
+                if new_category_id
+                else _none()
+            ),
+        )
 
-        # Validar nova categoria se fornecida
-        if category_id and category_id != transaction.category_id:
-            category = await self._category_repo.get_by_id(
-                category_id, user_id
-            )
+        if new_account_id and not account:
+            raise AccountNotFoundError(str(account_id), str(user_id))
+
+        if new_category_id:
             if not category:
                 raise CategoryNotFoundError(str(category_id), str(user_id))
 
@@ -186,35 +228,62 @@ class TransactionServiceImpl(TransactionServicePort):
                     f"mas transação é do tipo {tx_type}"
                 )
 
-        # Atualizar campos
-        if account_id:
-            transaction.update_account(account_id)
-        if category_id:
-            transaction.update_category(category_id)
-        if transaction_type:
-            transaction.type = transaction_type
+        # Alterar uma cópia: se alguma validação falhar, a transação
+        # armazenada (e o índice do repositório) permanece intacta
+        draft = transaction.model_copy()
+
+        # Atualizar apenas os campos efetivamente alterados
+        changed = False
+        needs_balance_refresh = False
+        if new_account_id:
+            draft.update_account(new_account_id)
+            changed = needs_balance_refresh = True
+        if new_category_id:
+            draft.update_category(new_category_id)
+            changed = True
+        if transaction_type and transaction_type != draft.type:
+            draft.type = transaction_type
+            changed = needs_balance_refresh = True
         if amount is not None:
-            if amount <= 0:
-                raise InvalidTransactionAmountError(amount)
-            transaction.update_amount(Decimal(str(amount)))
-        if description:
-            transaction.update_description(description)
-        if date:
-            transaction.update_date(date)
+            new_amount = _parse_amount(amount)
+            if new_amount != draft.amount:
+                draft.update_amount(new_amount)
+                changed = needs_balance_refresh = True
+        if description and description.strip() != draft.description:
+            draft.update_description(description)
+            changed = True
+        if date and date != draft.date:
+            draft.update_date(date)
+            changed = True
         if is_recurring is not None:
             if is_recurring and recurrence_frequency:
-                frequency_enum = RecurrenceType(recurrence_frequency)
-                transaction.make_recurring(frequency_enum)
-            elif not is_recurring:
-                transaction.remove_recurrence()
+                frequency_enum = _resolve_recurrence(recurrence_frequency)
+                if (
+                    not draft.is_recurring
+                    or draft.recurrence_frequency != frequency_enum
+                ):
+                    draft.make_recurring(frequency_enum)
+                    changed = True
+            elif not is_recurring and draft.is_recurring:
+                draft.remove_recurrence()
+                changed = True
+
+        # Nada mudou: evita escrita e recálculo de saldo
+        if not changed:
+            return transaction
 
         # Salvar alterações
-        updated_transaction = await self._transaction_repo.update(transaction)
-
-        # Recalcular saldos das contas afetadas
-        await self._update_account_balance(old_account_id, user_id)
-        if account_id and account_id != old_account_id:
-            await self._update_account_balance(account_id, user_id)
+        updated_transaction = await self._transaction_repo.update(draft)
+
+        # Recalcular saldos apenas se valor, tipo ou conta mudaram
+        if needs_balance_refresh:
+            affected_accounts = {old_account_id, draft.account_id}
+            await asyncio.gather(
+                *(
+                    self._update_account_balance(affected_id, user_id)
+                    for affected_id in affected_accounts
+                )
+            )
 
         return updated_transaction
 
@@ -236,25 +305,17 @@ class TransactionServiceImpl(TransactionServicePort):
         self, transaction_id: UUID, user_id: UUID, new_date: datetime
     ) -> Transaction:
         """Duplica uma transação com nova data."""
-        # Buscar transação original
-        original = await self.get_transaction_by_id(transaction_id, user_id)
-
-        # Criar nova transação
-        return await self.create_transaction(
-            user_id=user_id,
-            account_id=original.account_id,
-            category_id=original.category_id,
-            transaction_type=original.type,
-            amount=float(original.amount),
-            description=f"{original.description} (cópia)",
-            date=new_date,
-            is_recurring=original.is_recurring,
-            recurrence_frequency=(
-                original.recurrence_frequency.value
-                if original.recurrence_frequency
-                else None
-            ),
+        # Conta e categoria já foram validadas na transação original
+        duplicated = await self._transaction_repo.clone_with_date(
+            transaction_id, user_id, new_date, description_suffix=" (cópia)"
         )
+        if not duplicated:
+            raise TransactionNotFoundError(str(transaction_id), str(user_id))
+
+        # Atualizar saldo da conta
+        await self._update_account_balance(duplicated.account_id, user_id)
+
+        return duplicated
 
     async def _update_account_balance(
         self, account_id: UUID, user_id: UUID
@@ -268,7 +329,7 @@ class TransactionServiceImpl(TransactionServicePort):
         # Buscar conta e atualizar saldo
         account = await self._account_repo.get_by_id(account_id, user_id)
         if account:
-            account.update_balance(Decimal(str(balance)))
+            account.update_balance(_to_money(balance))
             await self._account_repo.update(account)
 
 
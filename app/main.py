@@ -5,20 +5,42 @@ Este módulo configura e inicializa a aplicação FastAPI com todas as
 configurações necessárias, middleware, rotas e documentação.
 """
 
+import importlib
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.adapters.inbound.auth_controller import router as auth_router
-from app.adapters.inbound.health_controller import health_router
 from app.config.settings import get_settings
 
 # Configuração do logger
 logger = logging.getLogger(__name__)
 
+# Routers registrados na aplicação, na ordem de registro ("módulo:atributo")
+_ROUTERS = (
+    "app.adapters.inbound.health_controller:health_router",
+    "app.adapters.inbound.auth_controller:router",
+    "app.adapters.inbound.account_controller:router",
+    "app.adapters.inbound.transaction_controller:router",
+    "app.adapters.inbound.category_controller:router",
+    "app.adapters.controllers.dashboard_controller:router",
+    "app.adapters.inbound.goal_controller:router",
+    "app.adapters.inbound.budget_controller:router",
+)
+
+
+class FinanceORJSONResponse(ORJSONResponse):
+    """Resposta JSON via orjson que serializa Decimal como string."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=str, option=orjson.OPT_NON_STR_KEYS
+        )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -56,6 +78,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         debug=settings.debug,
         lifespan=lifespan,
+        default_response_class=FinanceORJSONResponse,
         # Configurações da documentação
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
@@ -72,40 +95,10 @@ def create_app() -> FastAPI:
     )
 
     # Registro das rotas
-    app.include_router(health_router)
-    app.include_router(auth_router)
-
-    # Importar e registrar router de contas
-    from app.adapters.inbound.account_controller import (
-        router as account_router,
-    )
-
-    app.include_router(account_router)
-
-    # Importar e registrar routers de transações e categorias
-    from app.adapters.inbound.category_controller import (
-        router as category_router,
-    )
-    from app.adapters.inbound.transaction_controller import (
-        router as transaction_router,
-    )
-
-    app.include_router(transaction_router)
-    app.include_router(category_router)
-
-    # Importar e registrar router de dashboard
-    from app.adapters.controllers.dashboard_controller import (
-        router as dashboard_router,
-    )
-
-    app.include_router(dashboard_router)
-
-    # Importar e registrar routers de metas e orçamentos
-    from app.adapters.inbound.budget_controller import router as budget_router
-    from app.adapters.inbound.goal_controller import router as goal_router
-
-    app.include_router(goal_router)
-    app.include_router(budget_router)
+    for router_path in _ROUTERS:
+        module_name, attribute = router_path.split(":")
+        module = importlib.import_module(module_name)
+        app.include_router(getattr(module, attribute))
 
     return app
 
@@ -5,21 +5,131 @@ Este módulo contém fixtures e configurações compartilhadas
 entre todos os testes da aplicação.
 """
 
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Mapping
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
 import pytest
 from fastapi.testclient import TestClient
+from pytest_asyncio import is_async_test
 
 from app.adapters.inbound.account_controller import _account_repository
 from app.adapters.inbound.auth_middleware import (
+    _email_service,
     _password_reset_repository,
+    _password_service,
+    _token_service,
     _user_repository,
 )
 from app.adapters.inbound.transaction_controller import (
     _category_repository,
     _transaction_repository,
 )
+from app.core.domain.account import Account
+from app.core.domain.user import User
 from app.main import app
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Usa o uvloop nos testes assíncronos quando disponível.
+
+    O uvloop já vem com `uvicorn[standard]` (exceto no Windows); sem ele,
+    mantém a política padrão do asyncio.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+def _run_outside_session_loop(coro):
+    """
+    Executa a corrotina num loop próprio, sem trocar o loop corrente.
+
+    `asyncio.run` redefine o loop corrente para `None` ao terminar, o que
+    derrubaria o loop de sessão usado pelos testes assíncronos.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.fixture(scope="session")
+def run_in_private_loop():
+    """
+    Fixture que executa corrotinas num loop próprio, fora do loop de sessão.
+
+    Para fixtures síncronas que precisam preparar dados assíncronos.
+
+    Returns:
+        Callable[[Coroutine], Any]: Função que executa a corrotina
+    """
+    return _run_outside_session_loop
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Executa todos os testes assíncronos no mesmo event loop da sessão.
+
+    O pytest-asyncio 0.23 não tem opção de configuração para o escopo
+    padrão do loop; este é o caminho indicado na documentação dele.
+    """
+    session_scope_marker = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_password_hashing():
+    """
+    Reduz o custo do bcrypt durante os testes.
+
+    O hashing continua real (mesmo algoritmo e formato), apenas com o fator
+    de custo mínimo aceito pelo bcrypt.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_password_service, "_rounds", 4)
+        yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def silent_email_sender():
+    """
+    Substitui o envio de e-mail da aplicação por um mock durante os testes.
+
+    O comportamento real do serviço é coberto pelos testes unitários.
+
+    Yields:
+        AsyncMock: Mock de `send_password_reset_email`
+    """
+    sender = AsyncMock(return_value=True)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_email_service, "send_password_reset_email", sender)
+        yield sender
+
+
+@pytest.fixture
+def email_sender(silent_email_sender):
+    """
+    Fixture com o mock de envio de e-mail zerado para o teste atual.
+
+    Returns:
+        AsyncMock: Mock de `send_password_reset_email`
+    """
+    silent_email_sender.reset_mock()
+    return silent_email_sender
+
+
 @pytest.fixture(autouse=True)
 def clear_repositories():
     """
@@ -33,15 +143,142 @@ def clear_repositories():
     yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
     """
     Fixture que fornece um cliente de teste para a aplicação FastAPI.
 
-    Returns:
+    O cliente é compartilhado por toda a sessão de testes, de modo que o
+    lifespan da aplicação executa uma única vez. O isolamento entre testes
+    é garantido por `clear_repositories`.
+
+    Yields:
         TestClient: Cliente configurado para testes
     """
-    return TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client):
+    """
+    Fixture com o schema OpenAPI da aplicação, obtido uma única vez.
+
+    Returns:
+        dict: Documento retornado por /openapi.json
+    """
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
+
+
+def _bearer_headers(user_id: str) -> Mapping[str, str]:
+    """
+    Emite um token de acesso diretamente, sem passar por /auth/login.
+
+    Os headers são somente leitura para que o mesmo objeto possa ser
+    compartilhado entre testes sem risco de alteração.
+    """
+    token = _token_service.create_access_token(user_id)
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
+@pytest.fixture(scope="session")
+def session_auth():
+    """
+    Cria um único usuário para toda a sessão de testes.
+
+    O usuário é montado diretamente (sem /auth/register) e o token é
+    emitido pelo serviço JWT, sem o custo de login via HTTP. A inserção
+    no repositório fica a cargo de `auth_user`, após cada limpeza.
+
+    Returns:
+        tuple: Usuário da sessão e headers de autenticação
+    """
+    now = datetime.utcnow()
+    user = User(
+        id=str(uuid4()),
+        name="Session User",
+        email=f"u{uuid4().hex}@example.com",
+        password_hash=_password_service.hash_password("TestPassword123!"),
+        created_at=now,
+        updated_at=now,
+    )
+
+    return user, _bearer_headers(user.id)
+
+
+@pytest.fixture
+def mint_token():
+    """
+    Fixture que emite headers de autenticação para um usuário qualquer.
+
+    Use em testes que não validam o fluxo de login em si.
+
+    Returns:
+        Callable[[User], Mapping]: Função que gera headers Bearer
+    """
+
+    def _mint(user) -> Mapping[str, str]:
+        return _bearer_headers(user.id)
+
+    return _mint
+
+
+@pytest.fixture
+def auth_user(session_auth):
+    """
+    Fixture que restaura o usuário da sessão após a limpeza dos repositórios.
+
+    Returns:
+        User: Usuário autenticado da sessão
+    """
+    user, _ = session_auth
+    _user_repository.add_user(user)
+    return user
+
+
+@pytest.fixture
+def auth_headers(session_auth, auth_user):
+    """
+    Fixture com headers de autenticação do usuário da sessão.
+
+    Returns:
+        Mapping: Headers (somente leitura) com o token Bearer
+    """
+    _, headers = session_auth
+    return headers
+
+
+@pytest.fixture
+def seed_accounts(auth_user):
+    """
+    Fixture que insere contas diretamente no repositório.
+
+    Evita uma chamada POST por conta quando o teste não valida a criação.
+
+    Returns:
+        Callable[[List[dict]], List[Account]]: Função que cria as contas
+    """
+
+    user_id = UUID(auth_user.id)
+
+    def _seed(specs):
+        accounts = [
+            Account(
+                user_id=user_id,
+                name=spec["name"],
+                type=spec["type"],
+                balance=Decimal(str(spec.get("balance", "0.00"))),
+                is_primary=spec.get("is_primary", False),
+            )
+            for spec in specs
+        ]
+        return _run_outside_session_loop(
+            _account_repository.create_many(accounts)
+        )
+
+    return _seed
 
 
 @pytest.fixture
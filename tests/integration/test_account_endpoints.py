@@ -5,79 +5,47 @@ Testa todos os endpoints REST de CRUD para contas, com autenticação,
 validações e tratamento de erros.
 """
 
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
-
-client = TestClient(app)
-
-
-@pytest.fixture
-def valid_user_payload():
-    """Fixture para dados válidos de usuário."""
-    return {
-        "name": "João Silva",
-        "email": "joao@example.com",
-        "password": "MinhaSenh@123",
-    }
-
-
-@pytest.fixture
-def valid_account_payload():
-    """Fixture para dados válidos de conta."""
-    return {
-        "name": "Conta Corrente Principal",
-        "type": "checking",
-        "balance": 1000.0,
-        "is_primary": True,
-    }
-
-
-@pytest.fixture
-def savings_account_payload():
-    """Fixture para dados de conta poupança."""
-    return {
-        "name": "Poupança",
-        "type": "savings",
-        "balance": 500.0,
-        "is_primary": False,
-    }
-
-
-@pytest.fixture
-def credit_card_payload():
-    """Fixture para dados de cartão de crédito."""
-    return {
-        "name": "Cartão Visa",
-        "type": "credit_card",
-        "balance": -200.0,
-        "is_primary": False,
-    }
+pytestmark = pytest.mark.integration
+
+# Dados válidos de conta corrente principal.
+VALID_ACCOUNT_PAYLOAD = {
+    "name": "Conta Corrente Principal",
+    "type": "checking",
+    "balance": 1000.0,
+    "is_primary": True,
+}
+
+# Dados de conta poupança.
+SAVINGS_ACCOUNT_PAYLOAD = {
+    "name": "Poupança",
+    "type": "savings",
+    "balance": 500.0,
+    "is_primary": False,
+}
+
+# Dados de cartão de crédito.
+CREDIT_CARD_PAYLOAD = {
+    "name": "Cartão Visa",
+    "type": "credit_card",
+    "balance": -200.0,
+    "is_primary": False,
+}
 
 
 class TestAccountCreation:
     """Testes para criação de contas."""
 
-    def test_create_account_success(
-        self, valid_user_payload, valid_account_payload
-    ):
+    def test_create_account_success(self, client, auth_headers):
         """Deve criar conta com sucesso para usuário autenticado."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-
         # Criar conta
-        headers = {"Authorization": f"Bearer {token}"}
         response = client.post(
-            "/api/v1/accounts/", json=valid_account_payload, headers=headers
+            "/api/v1/accounts/",
+            json=VALID_ACCOUNT_PAYLOAD,
+            headers=auth_headers,
         )
 
         assert response.status_code == 201
@@ -91,52 +59,11 @@ class TestAccountCreation:
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_create_account_unauthorized(self, valid_account_payload):
-        """Deve falhar ao criar conta sem autenticação."""
-        response = client.post("/api/v1/accounts/", json=valid_account_payload)
-        assert response.status_code == 403
-
-    def test_create_account_invalid_type(self, valid_user_payload):
-        """Deve falhar com tipo de conta inválido."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-
-        # Tentar criar conta com tipo inválido
-        invalid_payload = {
-            "name": "Conta Inválida",
-            "type": "invalid_type",
-            "balance": 100.0,
-        }
-        headers = {"Authorization": f"Bearer {token}"}
-        response = client.post(
-            "/api/v1/accounts/", json=invalid_payload, headers=headers
-        )
-
-        assert response.status_code == 422  # Validation error
-
-    def test_create_credit_card_negative_balance(
-        self, valid_user_payload, credit_card_payload
-    ):
+    def test_create_credit_card_negative_balance(self, client, auth_headers):
         """Deve permitir saldo negativo para cartão de crédito."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-
         # Criar cartão com saldo negativo
-        headers = {"Authorization": f"Bearer {token}"}
         response = client.post(
-            "/api/v1/accounts/", json=credit_card_payload, headers=headers
+            "/api/v1/accounts/", json=CREDIT_CARD_PAYLOAD, headers=auth_headers
         )
 
         assert response.status_code == 201
@@ -144,26 +71,18 @@ class TestAccountCreation:
         assert data["type"] == "credit_card"
         assert float(data["balance"]) == -200.0
 
-    def test_create_account_negative_balance_invalid(self, valid_user_payload):
+    def test_create_account_negative_balance_invalid(
+        self, client, auth_headers
+    ):
         """Deve falhar com saldo negativo para conta que não permite."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-
         # Tentar criar conta corrente com saldo negativo
         invalid_payload = {
             "name": "Conta Corrente",
             "type": "checking",
             "balance": -100.0,
         }
-        headers = {"Authorization": f"Bearer {token}"}
         response = client.post(
-            "/api/v1/accounts/", json=invalid_payload, headers=headers
+            "/api/v1/accounts/", json=invalid_payload, headers=auth_headers
         )
 
         assert response.status_code == 400
@@ -173,51 +92,26 @@ class TestAccountCreation:
 class TestAccountListing:
     """Testes para listagem de contas."""
 
-    def test_list_accounts_empty(self, valid_user_payload):
+    def test_list_accounts_empty(self, client, auth_headers):
         """Deve retornar lista vazia para usuário sem contas."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-
         # Listar contas
-        headers = {"Authorization": f"Bearer {token}"}
-        response = client.get("/api/v1/accounts/", headers=headers)
+        response = client.get("/api/v1/accounts/", headers=auth_headers)
 
         assert response.status_code == 200
         assert response.json() == []
 
     def test_list_accounts_with_data(
         self,
-        valid_user_payload,
-        valid_account_payload,
-        savings_account_payload,
+        client,
+        auth_headers,
+        seed_accounts,
     ):
         """Deve listar contas do usuário ordenadas."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
         # Criar duas contas
-        client.post(
-            "/api/v1/accounts/", json=valid_account_payload, headers=headers
-        )
-        client.post(
-            "/api/v1/accounts/", json=savings_account_payload, headers=headers
-        )
+        seed_accounts([VALID_ACCOUNT_PAYLOAD, SAVINGS_ACCOUNT_PAYLOAD])
 
         # Listar contas
-        response = client.get("/api/v1/accounts/", headers=headers)
+        response = client.get("/api/v1/accounts/", headers=auth_headers)
 
         assert response.status_code == 200
         accounts = response.json()
@@ -236,38 +130,23 @@ class TestAccountListing:
         assert len(primary_accounts) == 1
         assert accounts[0]["is_primary"] is True
 
-    def test_list_accounts_unauthorized(self):
-        """Deve falhar ao listar contas sem autenticação."""
-        response = client.get("/api/v1/accounts/")
-        assert response.status_code == 403
-
 
 class TestAccountRetrieval:
     """Testes para busca de conta específica."""
 
-    def test_get_account_success(
-        self, valid_user_payload, valid_account_payload
-    ):
+    def test_get_account_success(self, client, auth_headers):
         """Deve buscar conta específica com sucesso."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
         # Criar conta
         create_response = client.post(
-            "/api/v1/accounts/", json=valid_account_payload, headers=headers
+            "/api/v1/accounts/",
+            json=VALID_ACCOUNT_PAYLOAD,
+            headers=auth_headers,
         )
         account_id = create_response.json()["id"]
 
         # Buscar conta
         response = client.get(
-            f"/api/v1/accounts/{account_id}", headers=headers
+            f"/api/v1/accounts/{account_id}", headers=auth_headers
         )
 
         assert response.status_code == 200
@@ -278,59 +157,26 @@ class TestAccountRetrieval:
         assert "updated_at" in data
         assert "is_active" in data
 
-    def test_get_account_not_found(self, valid_user_payload):
-        """Deve falhar ao buscar conta inexistente."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Buscar conta inexistente
-        fake_id = str(uuid4())
-        response = client.get(f"/api/v1/accounts/{fake_id}", headers=headers)
-
-        assert response.status_code == 404
-        assert "não encontrada" in response.json()["detail"].lower()
-
-    def test_get_account_unauthorized(self):
-        """Deve falhar ao buscar conta sem autenticação."""
-        fake_id = str(uuid4())
-        response = client.get(f"/api/v1/accounts/{fake_id}")
-        assert response.status_code == 403
-
 
 class TestAccountUpdate:
     """Testes para atualização de contas."""
 
-    def test_update_account_name(
-        self, valid_user_payload, valid_account_payload
-    ):
+    def test_update_account_name(self, client, auth_headers):
         """Deve atualizar nome da conta."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
         # Criar conta
         create_response = client.post(
-            "/api/v1/accounts/", json=valid_account_payload, headers=headers
+            "/api/v1/accounts/",
+            json=VALID_ACCOUNT_PAYLOAD,
+            headers=auth_headers,
         )
         account_id = create_response.json()["id"]
 
         # Atualizar nome
         update_data = {"name": "Novo Nome da Conta"}
         response = client.put(
-            f"/api/v1/accounts/{account_id}", json=update_data, headers=headers
+            f"/api/v1/accounts/{account_id}",
+            json=update_data,
+            headers=auth_headers,
         )
 
         assert response.status_code == 200
@@ -338,153 +184,78 @@ class TestAccountUpdate:
         assert data["name"] == "Novo Nome da Conta"
         assert data["id"] == account_id
 
-    def test_update_account_balance(
-        self, valid_user_payload, valid_account_payload
-    ):
+    def test_update_account_balance(self, client, auth_headers):
         """Deve atualizar saldo da conta."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
         # Criar conta
         create_response = client.post(
-            "/api/v1/accounts/", json=valid_account_payload, headers=headers
+            "/api/v1/accounts/",
+            json=VALID_ACCOUNT_PAYLOAD,
+            headers=auth_headers,
         )
         account_id = create_response.json()["id"]
 
         # Atualizar saldo
         update_data = {"balance": 2500.75}
         response = client.put(
-            f"/api/v1/accounts/{account_id}", json=update_data, headers=headers
+            f"/api/v1/accounts/{account_id}",
+            json=update_data,
+            headers=auth_headers,
         )
 
         assert response.status_code == 200
         data = response.json()
         assert float(data["balance"]) == 2500.75
 
-    def test_update_account_not_found(self, valid_user_payload):
-        """Deve falhar ao atualizar conta inexistente."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Tentar atualizar conta inexistente
-        fake_id = str(uuid4())
-        update_data = {"name": "Novo Nome"}
-        response = client.put(
-            f"/api/v1/accounts/{fake_id}", json=update_data, headers=headers
-        )
-
-        assert response.status_code == 404
-
 
 class TestAccountDeletion:
     """Testes para exclusão de contas."""
 
     def test_delete_account_success(
         self,
-        valid_user_payload,
-        valid_account_payload,
-        savings_account_payload,
+        client,
+        auth_headers,
+        seed_accounts,
     ):
         """Deve deletar conta quando há múltiplas contas."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
         # Criar duas contas
-        client.post(
-            "/api/v1/accounts/", json=valid_account_payload, headers=headers
-        )
-        create2 = client.post(
-            "/api/v1/accounts/", json=savings_account_payload, headers=headers
+        _, savings = seed_accounts(
+            [VALID_ACCOUNT_PAYLOAD, SAVINGS_ACCOUNT_PAYLOAD]
         )
-        account_id = create2.json()["id"]
+        account_id = str(savings.id)
 
         # Deletar segunda conta
         response = client.delete(
-            f"/api/v1/accounts/{account_id}", headers=headers
+            f"/api/v1/accounts/{account_id}", headers=auth_headers
         )
 
         assert response.status_code == 204
 
         # Verificar que conta foi removida
         get_response = client.get(
-            f"/api/v1/accounts/{account_id}", headers=headers
+            f"/api/v1/accounts/{account_id}", headers=auth_headers
         )
         assert get_response.status_code == 404
 
-    def test_delete_account_not_found(self, valid_user_payload):
-        """Deve falhar ao deletar conta inexistente."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Tentar deletar conta inexistente
-        fake_id = str(uuid4())
-        response = client.delete(
-            f"/api/v1/accounts/{fake_id}", headers=headers
-        )
-
-        assert response.status_code == 404
-
 
 class TestPrimaryAccount:
     """Testes para gestão de conta principal."""
 
     def test_set_primary_account(
         self,
-        valid_user_payload,
-        valid_account_payload,
-        savings_account_payload,
+        client,
+        auth_headers,
+        seed_accounts,
     ):
         """Deve definir conta como principal."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-
         # Criar duas contas
-        client.post(
-            "/api/v1/accounts/", json=valid_account_payload, headers=headers
-        )
-        create2 = client.post(
-            "/api/v1/accounts/", json=savings_account_payload, headers=headers
+        _, savings = seed_accounts(
+            [VALID_ACCOUNT_PAYLOAD, SAVINGS_ACCOUNT_PAYLOAD]
         )
-        account_id = create2.json()["id"]
+        account_id = str(savings.id)
 
         # Definir segunda conta como principal
         response = client.patch(
-            f"/api/v1/accounts/{account_id}/set-primary", headers=headers
+            f"/api/v1/accounts/{account_id}/set-primary", headers=auth_headers
         )
 
         assert response.status_code == 200
@@ -492,22 +263,46 @@ class TestPrimaryAccount:
         assert data["is_primary"] is True
         assert data["id"] == account_id
 
-    def test_set_primary_account_not_found(self, valid_user_payload):
-        """Deve falhar ao definir conta inexistente como principal."""
-        # Registrar e fazer login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        login_response = client.post("/auth/login", json=login_data)
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
 
-        # Tentar definir conta inexistente como principal
+class TestAccountErrors:
+    """Testes de erros comuns aos endpoints de conta."""
+
+    @pytest.mark.parametrize(
+        "method,path_suffix,payload",
+        [
+            ("get", "", None),
+            ("put", "", {"name": "Novo Nome"}),
+            ("delete", "", None),
+            ("patch", "/set-primary", None),
+        ],
+    )
+    def test_account_not_found(
+        self, client, auth_headers, method, path_suffix, payload
+    ):
+        """Deve retornar 404 para conta inexistente em qualquer operação."""
         fake_id = str(uuid4())
-        response = client.patch(
-            f"/api/v1/accounts/{fake_id}/set-primary", headers=headers
+        kwargs = {"json": payload} if payload is not None else {}
+        response = client.request(
+            method,
+            f"/api/v1/accounts/{fake_id}{path_suffix}",
+            headers=auth_headers,
+            **kwargs,
         )
 
         assert response.status_code == 404
+        assert "não encontrada" in response.json()["detail"].lower()
+
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("post", "/api/v1/accounts/"),
+            ("get", "/api/v1/accounts/"),
+            ("get", f"/api/v1/accounts/{UUID(int=0)}"),
+        ],
+    )
+    def test_account_unauthorized(self, client, method, path):
+        """Deve falhar sem autenticação."""
+        kwargs = {"json": VALID_ACCOUNT_PAYLOAD} if method == "post" else {}
+        response = client.request(method, path, **kwargs)
+
+        assert response.status_code == 403
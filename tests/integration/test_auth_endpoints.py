@@ -1,86 +1,73 @@
-import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
+from datetime import datetime, timedelta
+from uuid import uuid4
 
-client = TestClient(app)
+import pytest
 
+from app.adapters.outbound import jwt_service
 
-@pytest.fixture
-def valid_user_payload():
-    """Dados válidos para criação de usuário."""
-    return {
-        "name": "João Silva",
-        "email": "joao@example.com",
-        "password": "MinhaSenh@123",
-    }
+pytestmark = pytest.mark.integration
 
+# Dados válidos para criação de usuário (e-mail único por execução).
+VALID_USER_PAYLOAD = {
+    "name": "João Silva",
+    "email": f"joao.{uuid4().hex}@example.com",
+    "password": "MinhaSenh@123",
+}
 
-@pytest.fixture
-def invalid_user_payload():
-    """Dados inválidos para criação de usuário."""
-    return {
-        "name": "João Silva",
-        "email": "joao@example.com",
-        "password": "123",  # Senha muito simples
-    }
+# Dados inválidos para criação de usuário.
+INVALID_USER_PAYLOAD = {
+    "name": "João Silva",
+    "email": "joao@example.com",
+    "password": "123",  # Senha muito simples
+}
 
 
 class TestRegisterEndpoint:
     """Testes para endpoint de registro."""
 
-    def test_register_valid_user(self, valid_user_payload):
+    def test_register_valid_user(self, client):
         """Deve registrar usuário com dados válidos."""
-        response = client.post("/auth/register", json=valid_user_payload)
+        response = client.post("/auth/register", json=VALID_USER_PAYLOAD)
 
         assert response.status_code == 200
         data = response.json()
-        assert data["name"] == valid_user_payload["name"]
-        assert data["email"] == valid_user_payload["email"]
+        assert data["name"] == VALID_USER_PAYLOAD["name"]
+        assert data["email"] == VALID_USER_PAYLOAD["email"]
         assert "id" in data
         assert "created_at" in data
         assert "password" not in data  # Senha não deve ser retornada
 
-    def test_register_invalid_password(self, invalid_user_payload):
+    def test_register_invalid_password(self, client):
         """Deve rejeitar usuário com senha inválida."""
-        response = client.post("/auth/register", json=invalid_user_payload)
+        response = client.post("/auth/register", json=INVALID_USER_PAYLOAD)
 
         assert response.status_code == 422
         assert "Senha deve ter" in response.json()["detail"][0]["msg"]
 
-    def test_register_duplicate_email(self, valid_user_payload):
+    def test_register_duplicate_email(self, client):
         """Deve rejeitar usuário com e-mail duplicado."""
         # Primeiro registro
-        client.post("/auth/register", json=valid_user_payload)
+        client.post("/auth/register", json=VALID_USER_PAYLOAD)
 
         # Segundo registro com mesmo e-mail
-        response = client.post("/auth/register", json=valid_user_payload)
+        response = client.post("/auth/register", json=VALID_USER_PAYLOAD)
 
         assert response.status_code == 409
         assert "já está em uso" in response.json()["detail"]
 
-    def test_register_invalid_email_format(self, valid_user_payload):
-        """Deve rejeitar usuário com formato de e-mail inválido."""
-        payload = valid_user_payload.copy()
-        payload["email"] = "email-invalido"
-
-        response = client.post("/auth/register", json=payload)
-
-        assert response.status_code == 422
-
 
 class TestLoginEndpoint:
     """Testes para endpoint de login."""
 
-    def test_login_valid_credentials(self, valid_user_payload):
+    def test_login_valid_credentials(self, client):
         """Deve autenticar usuário com credenciais válidas."""
         # Registra usuário
-        client.post("/auth/register", json=valid_user_payload)
+        client.post("/auth/register", json=VALID_USER_PAYLOAD)
 
         # Faz login
         login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
+            "email": VALID_USER_PAYLOAD["email"],
+            "password": VALID_USER_PAYLOAD["password"],
         }
         response = client.post("/auth/login", json=login_data)
 
@@ -90,9 +77,9 @@ class TestLoginEndpoint:
         assert data["token_type"] == "bearer"
         assert "expires_in" in data
         assert "user" in data
-        assert data["user"]["email"] == valid_user_payload["email"]
+        assert data["user"]["email"] == VALID_USER_PAYLOAD["email"]
 
-    def test_login_invalid_email(self):
+    def test_login_invalid_email(self, client):
         """Deve rejeitar login com e-mail inexistente."""
         login_data = {
             "email": "inexistente@example.com",
@@ -103,14 +90,14 @@ class TestLoginEndpoint:
         assert response.status_code == 401
         assert "Credenciais inválidas" in response.json()["detail"]
 
-    def test_login_invalid_password(self, valid_user_payload):
+    def test_login_invalid_password(self, client):
         """Deve rejeitar login com senha incorreta."""
         # Registra usuário
-        client.post("/auth/register", json=valid_user_payload)
+        client.post("/auth/register", json=VALID_USER_PAYLOAD)
 
         # Tenta login com senha incorreta
         login_data = {
-            "email": valid_user_payload["email"],
+            "email": VALID_USER_PAYLOAD["email"],
             "password": "SenhaErrada123",
         }
         response = client.post("/auth/login", json=login_data)
@@ -122,39 +109,24 @@ class TestLoginEndpoint:
 class TestProtectedEndpoints:
     """Testes para endpoints protegidos."""
 
-    def get_auth_headers(self, valid_user_payload):
-        """Helper para obter headers de autenticação."""
-        # Registra usuário
-        client.post("/auth/register", json=valid_user_payload)
-
-        # Faz login
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        response = client.post("/auth/login", json=login_data)
-        token = response.json()["access_token"]
-
-        return {"Authorization": f"Bearer {token}"}
-
-    def test_get_current_user_with_valid_token(self, valid_user_payload):
+    def test_get_current_user_with_valid_token(
+        self, client, auth_user, auth_headers
+    ):
         """Deve retornar dados do usuário com token válido."""
-        headers = self.get_auth_headers(valid_user_payload)
-
-        response = client.get("/auth/me", headers=headers)
+        response = client.get("/auth/me", headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
-        assert data["email"] == valid_user_payload["email"]
-        assert data["name"] == valid_user_payload["name"]
+        assert data["email"] == auth_user.email
+        assert data["name"] == auth_user.name
 
-    def test_get_current_user_without_token(self):
+    def test_get_current_user_without_token(self, client):
         """Deve rejeitar acesso sem token."""
         response = client.get("/auth/me")
 
         assert response.status_code == 403  # Forbidden
 
-    def test_get_current_user_with_invalid_token(self):
+    def test_get_current_user_with_invalid_token(self, client):
         """Deve rejeitar token inválido."""
         headers = {"Authorization": "Bearer token-invalido"}
 
@@ -167,21 +139,21 @@ class TestProtectedEndpoints:
 class TestPasswordReset:
     """Testes para reset de senha."""
 
-    def test_forgot_password_existing_user(self, valid_user_payload):
+    def test_forgot_password_existing_user(
+        self, client, auth_user, email_sender
+    ):
         """Deve aceitar solicitação de reset para usuário existente."""
-        # Registra usuário
-        client.post("/auth/register", json=valid_user_payload)
-
-        # Solicita reset
         response = client.post(
             "/auth/forgot-password",
-            json={"email": valid_user_payload["email"]},
+            json={"email": auth_user.email},
         )
 
         assert response.status_code == 200
         assert "receberá as instruções" in response.json()["message"]
+        email_sender.assert_awaited_once()
+        assert email_sender.await_args.args[0] == auth_user.email
 
-    def test_forgot_password_nonexistent_user(self):
+    def test_forgot_password_nonexistent_user(self, client, email_sender):
         """Deve retornar sucesso mesmo para usuário inexistente."""
         response = client.post(
             "/auth/forgot-password", json={"email": "inexistente@example.com"}
@@ -189,8 +161,9 @@ class TestPasswordReset:
 
         assert response.status_code == 200
         assert "receberá as instruções" in response.json()["message"]
+        email_sender.assert_not_awaited()
 
-    def test_reset_password_invalid_token(self):
+    def test_reset_password_invalid_token(self, client):
         """Deve rejeitar token inválido para reset."""
         response = client.post(
             "/auth/reset-password",
@@ -204,34 +177,31 @@ class TestPasswordReset:
 class TestRefreshToken:
     """Testes para renovação de token."""
 
-    def test_refresh_valid_token(self, valid_user_payload):
+    def test_refresh_valid_token(
+        self, client, auth_user, mint_token, monkeypatch
+    ):
         """Deve renovar token válido."""
-        import time
+        headers = mint_token(auth_user)
 
-        # Registra usuário e faz login
-        client.post("/auth/register", json=valid_user_payload)
-        login_data = {
-            "email": valid_user_payload["email"],
-            "password": valid_user_payload["password"],
-        }
-        response = client.post("/auth/login", json=login_data)
-        token = response.json()["access_token"]
+        # Avança o relógio do serviço JWT em vez de dormir
+        class _AdvancedClock(datetime):
+            @classmethod
+            def utcnow(cls):
+                return datetime.utcnow() + timedelta(seconds=2)
 
-        # Espera um pouco para garantir timestamp diferente
-        time.sleep(1)
+        monkeypatch.setattr(jwt_service, "datetime", _AdvancedClock)
 
         # Renova token
-        headers = {"Authorization": f"Bearer {token}"}
         response = client.post("/auth/refresh", headers=headers)
 
         assert response.status_code == 200
         data = response.json()
         assert "access_token" in data
         assert data["token_type"] == "bearer"
-        # Remove assertion que compara tokens pois podem ser iguais
-        # dependendo da implementação
+        old_token = headers["Authorization"].removeprefix("Bearer ")
+        assert data["access_token"] != old_token
 
-    def test_refresh_invalid_token(self):
+    def test_refresh_invalid_token(self, client):
         """Deve rejeitar token inválido para renovação."""
         headers = {"Authorization": "Bearer token-invalido"}
         response = client.post("/auth/refresh", headers=headers)
@@ -4,19 +4,34 @@ Testes de integração para a aplicação principal.
 Testa a configuração e inicialização da aplicação FastAPI.
 """
 
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.main import app, create_app
+from app.main import FinanceORJSONResponse, app, create_app
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module")
+def fresh_app() -> FastAPI:
+    """
+    Fixture com uma nova instância da aplicação, criada uma única vez.
+
+    Use apenas em testes que precisam de um app diferente do `app` global.
+    """
+    return create_app()
 
 
 class TestApplicationIntegration:
     """Testes de integração para a aplicação principal."""
 
-    def test_create_app_returns_fastapi_instance(self):
+    def test_create_app_returns_fastapi_instance(self, fresh_app: FastAPI):
         """Testa se create_app retorna uma instância do FastAPI."""
-        test_app = create_app()
-
-        assert test_app is not None
+        assert isinstance(fresh_app, FastAPI)
+        assert fresh_app is not app
 
     def test_application_basic_configuration(self):
         """
@@ -28,6 +43,16 @@ class TestApplicationIntegration:
         assert app.version == "0.1.0"
         assert "Sistema de Controle Financeiro" in app.description
 
+    def test_default_response_class_serializes_decimal(self):
+        """
+        Testa se a resposta padrão usa orjson e serializa Decimal.
+
+        Verifica se valores monetários são renderizados como string.
+        """
+        response = FinanceORJSONResponse({"amount": Decimal("10.50")})
+
+        assert response.body == b'{"amount":"10.50"}'
+
     def test_health_endpoints_are_registered(self, client: TestClient):
         """
         Testa se os endpoints de health check estão registrados.
@@ -66,44 +91,37 @@ class TestApplicationIntegration:
 
         Verifica se a aplicação tem a estrutura esperada.
         """
-        # Verifica se a aplicação tem os componentes básicos
-        assert hasattr(app, "router"), "App deve ter router"
-        assert app.title == "Financeiro Backend"
+        # Verifica se o roteamento foi inicializado
+        assert app.router.routes, "App deve ter rotas registradas"
         # Se chegou até aqui, a aplicação foi inicializada corretamente
         # incluindo qualquer lifecycle/startup/shutdown configurado
 
+    @pytest.mark.skipif(
+        app.docs_url is None, reason="Documentação desabilitada (debug=False)"
+    )
+    @pytest.mark.parametrize("path", ["/docs", "/redoc"])
     def test_documentation_endpoints_in_development(
-        self, client: TestClient
+        self, client: TestClient, path: str
     ) -> None:
         """
         Testa se endpoints de documentação estão disponíveis.
 
-        Verifica se /docs e /redoc estão acessíveis.
+        Usa HEAD para validar status e content-type sem transferir o HTML.
         """
-        # Testar página de documentação Swagger
-        response = client.get("/docs")
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-
-        # Testar página de documentação ReDoc
-        response = client.get("/redoc")
+        response = client.head(path)
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_openapi_schema_is_generated(self, client: TestClient) -> None:
+    def test_openapi_schema_is_generated(self, openapi_schema: dict) -> None:
         """
         Testa se o schema OpenAPI é gerado corretamente.
 
         Verifica se o endpoint de schema retorna dados válidos.
         """
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
-
-        schema = response.json()
-        assert "openapi" in schema
-        assert "info" in schema
-        assert schema["info"]["title"] == "Financeiro Backend"
-        assert schema["info"]["version"] == "0.1.0"
+        assert "openapi" in openapi_schema
+        assert "info" in openapi_schema
+        assert openapi_schema["info"]["title"] == "Financeiro Backend"
+        assert openapi_schema["info"]["version"] == "0.1.0"
 
     def test_404_for_nonexistent_endpoints(self, client: TestClient) -> None:
         """
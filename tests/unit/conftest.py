@@ -0,0 +1,148 @@
+"""
+Fixtures compartilhadas pelos testes unitários.
+
+O usuário de teste é imutável nos testes de serviço, então é criado uma
+única vez por sessão em vez de a cada teste. Contas e categorias são
+validadas uma vez por classe e copiadas por teste. Os repositórios em
+memória e o serviço de transações são criados uma vez por classe; as
+classes que os usam declaram ``reset_repositories`` para começar cada teste
+com eles vazios.
+"""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.adapters.outbound.memory_repositories import (
+    InMemoryAccountRepository,
+    InMemoryCategoryRepository,
+    InMemoryTransactionRepository,
+)
+from app.core.domain.account import Account, AccountType
+from app.core.domain.transaction import Category, TransactionType
+from app.core.domain.user import User
+from app.core.services.transaction_service import TransactionServiceImpl
+
+
+@pytest.fixture(scope="session")
+def user_uuid():
+    """UUID do usuário de teste, sem reconverter ``user.id``."""
+    return uuid4()
+
+
+@pytest.fixture(scope="session")
+def user(user_uuid):
+    """Usuário de teste."""
+    now = datetime.utcnow()
+    return User(
+        id=str(user_uuid),
+        name="Test User",
+        email="test@example.com",
+        password_hash="Hashed_password1@",
+        created_at=now,
+        updated_at=now,
+        is_active=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Instante fixo usado como "agora" nas datas das transações de teste."""
+    return datetime(2024, 6, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="class")
+def account_template(user_uuid):
+    """Conta de teste, validada uma vez por classe."""
+    return Account(
+        id=uuid4(),
+        user_id=user_uuid,
+        name="Test Account",
+        type=AccountType.CHECKING,
+        balance=Decimal("0.00"),
+    )
+
+
+@pytest.fixture
+def make_account(account_template):
+    """Fábrica de contas: cópias do modelo com novo ID."""
+
+    def _make(**overrides):
+        return account_template.model_copy(update={"id": uuid4(), **overrides})
+
+    return _make
+
+
+@pytest.fixture(scope="class")
+def category_template(user_uuid):
+    """Categoria de teste, validada uma vez por classe."""
+    return Category(
+        id=uuid4(),
+        user_id=user_uuid,
+        name="Test Category",
+        type=TransactionType.EXPENSE,
+    )
+
+
+@pytest.fixture
+def make_category(category_template):
+    """Fábrica de categorias: cópias do modelo com novo ID."""
+
+    def _make(**overrides):
+        return category_template.model_copy(
+            update={"id": uuid4(), **overrides}
+        )
+
+    return _make
+
+
+@pytest.fixture(scope="class")
+def transaction_repo():
+    """Repositório de transações em memória."""
+    return InMemoryTransactionRepository()
+
+
+@pytest.fixture(scope="class")
+def category_repo():
+    """Repositório de categorias em memória."""
+    return InMemoryCategoryRepository()
+
+
+@pytest.fixture(scope="class")
+def account_repo():
+    """Repositório de contas em memória."""
+    return InMemoryAccountRepository()
+
+
+@pytest.fixture(scope="class")
+def service(transaction_repo, category_repo, account_repo):
+    """Serviço de transações sobre os repositórios da classe."""
+    return TransactionServiceImpl(
+        transaction_repository=transaction_repo,
+        category_repository=category_repo,
+        account_repository=account_repo,
+    )
+
+
+@pytest.fixture
+def seed(account_repo, category_repo):
+    """Popula contas e categorias do teste em lote."""
+
+    async def _seed(accounts=(), categories=()):
+        await asyncio.gather(
+            account_repo.create_many(list(accounts)),
+            category_repo.create_many(list(categories)),
+        )
+
+    return _seed
+
+
+@pytest.fixture
+def reset_repositories(transaction_repo, category_repo, account_repo):
+    """Limpa os repositórios compartilhados pela classe a cada teste."""
+    transaction_repo.clear()
+    category_repo.clear()
+    account_repo.clear()
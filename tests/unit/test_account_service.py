@@ -5,12 +5,16 @@ Testa toda a lógica de negócio de criação, atualização, exclusão
 e gestão de contas com validações e regras específicas.
 """
 
+import os
+from collections import defaultdict
 from decimal import Decimal
+from itertools import batched
 from uuid import UUID, uuid4
 
 import pytest
+from pydantic import ValidationError
 
-from app.core.domain.account import Account, AccountType
+from app.core.domain.account import Account, AccountType, CreateAccountRequest
 from app.core.domain.exceptions import (
     AccountNameNotUniqueError,
     AccountNotFoundError,
@@ -20,54 +24,102 @@ from app.core.domain.exceptions import (
 )
 from app.core.services.account_service import AccountServiceImpl
 
+# Valores monetários reutilizados (evita reconverter strings a cada teste).
+_D0 = Decimal("0.0")
+_D100 = Decimal("100.0")
+_D250_50 = Decimal("250.50")
+_D_MINUS_500 = Decimal("-500.0")
+
+# Pool de UUIDs v4 gerado com uma única leitura de os.urandom.
+_UUID_POOL = tuple(
+    UUID(bytes=bytes(chunk), version=4)
+    for chunk in batched(os.urandom(16 * 256), 16)
+)
+
 
 class MockAccountRepository:
-    """Mock do repositório de contas para testes."""
+    """Mock do repositório de contas para testes (com índices em memória)."""
 
     def __init__(self):
         self.accounts = {}
-        self.accounts_by_user = {}
         self.create_calls = []
         self.update_calls = []
         self.delete_calls = []
+        # Índices auxiliares para buscas O(1)
+        self._ids_by_user = defaultdict(dict)
+        self._id_by_name = {}
+        self._name_key_by_id = {}
+        self._primary_by_user = {}
+
+    def add(self, account: Account) -> None:
+        """Insere ou substitui conta mantendo os índices atualizados."""
+        account_id = account.id
+        user_id = account.user_id
+
+        old_key = self._name_key_by_id.pop(account_id, None)
+        if old_key is not None and self._id_by_name.get(old_key) == account_id:
+            del self._id_by_name[old_key]
+        name_key = (user_id, account.name.lower())
+        self._id_by_name[name_key] = account_id
+        self._name_key_by_id[account_id] = name_key
+
+        self._ids_by_user[user_id][account_id] = None
+        if account.is_primary:
+            self._primary_by_user[user_id] = account_id
+        elif self._primary_by_user.get(user_id) == account_id:
+            del self._primary_by_user[user_id]
+
+        self.accounts[account_id] = account
+
+    def bulk_insert(self, accounts: list[Account]) -> None:
+        """Insere várias contas novas de uma vez (sem tratar substituição)."""
+        ids = [account.id for account in accounts]
+        name_keys = [
+            (account.user_id, account.name.lower()) for account in accounts
+        ]
+
+        self.accounts.update(zip(ids, accounts))
+        self._id_by_name.update(zip(name_keys, ids))
+        self._name_key_by_id.update(zip(ids, name_keys))
+        for account_id, account in zip(ids, accounts):
+            self._ids_by_user[account.user_id][account_id] = None
+            if account.is_primary:
+                self._primary_by_user[account.user_id] = account_id
 
     async def create(self, account: Account) -> Account:
         self.create_calls.append(account)
-        self.accounts[str(account.id)] = account
+        self.add(account)
         return account
 
     async def get_by_id(self, account_id: UUID, user_id: UUID) -> Account:
-        account = self.accounts.get(str(account_id))
+        account = self.accounts.get(account_id)
         if account and account.user_id == user_id and account.is_active:
             return account
         return None
 
     async def get_by_user_id(self, user_id: UUID) -> list:
-        return [
-            account
-            for account in self.accounts.values()
-            if account.user_id == user_id and account.is_active
-        ]
+        accounts = (
+            self.accounts[account_id]
+            for account_id in self._ids_by_user.get(user_id, ())
+        )
+        return [account for account in accounts if account.is_active]
 
     async def get_by_name_and_user(self, name: str, user_id: UUID) -> Account:
-        for account in self.accounts.values():
-            if (
-                account.name.lower() == name.lower()
-                and account.user_id == user_id
-                and account.is_active
-            ):
-                return account
+        account_id = self._id_by_name.get((user_id, name.lower()))
+        account = self.accounts.get(account_id)
+        if account and account.is_active:
+            return account
         return None
 
     async def get_primary_account(self, user_id: UUID) -> Account:
-        for account in self.accounts.values():
-            if account.user_id == user_id and account.is_primary:
-                return account
+        account = self.accounts.get(self._primary_by_user.get(user_id))
+        if account and account.is_primary:
+            return account
         return None
 
     async def update(self, account: Account) -> Account:
         self.update_calls.append(account)
-        self.accounts[str(account.id)] = account
+        self.add(account)
         return account
 
     async def delete(self, account_id: UUID, user_id: UUID) -> bool:
@@ -86,8 +138,35 @@ class MockAccountRepository:
         pass
 
     async def count_user_accounts(self, user_id: UUID) -> int:
-        active_accounts = await self.get_by_user_id(user_id)
-        return len(active_accounts)
+        # O índice também guarda contas desativadas
+        return sum(
+            1
+            for account_id in self._ids_by_user.get(user_id, ())
+            if self.accounts[account_id].is_active
+        )
+
+
+# Conta de referência validada uma única vez na importação do módulo.
+_TEMPLATE_ACCOUNT = Account(
+    user_id=uuid4(),
+    name="tpl",
+    type=AccountType.CHECKING,
+    balance=_D0,
+)
+
+
+@pytest.fixture
+def next_uuid():
+    """Fixture que entrega UUIDs do pool, reiniciado a cada teste."""
+    return iter(_UUID_POOL).__next__
+
+
+@pytest.fixture
+def make_account(next_uuid):
+    """Fixture que cria contas copiando o template (sem revalidar)."""
+    return lambda **kw: _TEMPLATE_ACCOUNT.model_copy(
+        update={"id": next_uuid(), **kw}
+    )
 
 
 @pytest.fixture
@@ -103,17 +182,18 @@ def account_service(mock_repository):
 
 
 @pytest.fixture
-def user_id():
+def user_id(next_uuid):
     """Fixture para ID de usuário."""
-    return uuid4()
+    return next_uuid()
 
 
 @pytest.fixture
-def other_user_id():
+def other_user_id(next_uuid):
     """Fixture para ID de outro usuário."""
-    return uuid4()
+    return next_uuid()
 
 
+@pytest.mark.asyncio
 class TestAccountCreation:
     """Testes para criação de contas."""
 
@@ -130,7 +210,7 @@ class TestAccountCreation:
         assert account.user_id == user_id
         assert account.name == "Conta Corrente"
         assert account.type == AccountType.CHECKING
-        assert account.balance == Decimal("100.0")
+        assert account.balance == _D100
         assert account.is_primary is True
         assert account.is_active is True
 
@@ -142,7 +222,7 @@ class TestAccountCreation:
             user_id=user_id, name="Poupança", account_type="savings"
         )
 
-        assert account.balance == Decimal("0.0")
+        assert account.balance == _D0
         assert account.is_primary is False
 
     async def test_create_credit_card_with_negative_balance(
@@ -157,41 +237,40 @@ class TestAccountCreation:
         )
 
         assert account.type == AccountType.CREDIT_CARD
-        assert account.balance == Decimal("-500.0")
-
-    async def test_create_account_invalid_type(self, account_service, user_id):
-        """Deve falhar com tipo de conta inválido."""
-        with pytest.raises(InvalidAccountTypeError):
-            await account_service.create_account(
-                user_id=user_id,
-                name="Conta Inválida",
-                account_type="invalid_type",
-            )
-
-    async def test_create_account_negative_balance_invalid(
-        self, account_service, user_id
+        assert account.balance == _D_MINUS_500
+
+    @pytest.mark.parametrize(
+        "kwargs,exc",
+        [
+            ({"account_type": "invalid_type"}, InvalidAccountTypeError),
+            (
+                {"account_type": "checking", "balance": -100.0},
+                InvalidBalanceError,
+            ),
+        ],
+        ids=["invalid_type", "negative_balance"],
+    )
+    async def test_create_account_invalid(
+        self, account_service, user_id, kwargs, exc
     ):
-        """Deve falhar com saldo negativo para conta que não permite."""
-        with pytest.raises(InvalidBalanceError):
+        """Deve falhar com tipo inválido ou saldo negativo não permitido."""
+        with pytest.raises(exc):
             await account_service.create_account(
-                user_id=user_id,
-                name="Conta Corrente",
-                account_type="checking",
-                balance=-100.0,
+                user_id=user_id, name="Conta Inválida", **kwargs
             )
 
     async def test_create_account_duplicate_name(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve falhar ao criar conta com nome duplicado."""
         # Criar primeira conta
-        existing_account = Account(
+        existing_account = make_account(
             user_id=user_id,
             name="Conta Teste",
             type=AccountType.CHECKING,
-            balance=Decimal("0.0"),
+            balance=_D0,
         )
-        mock_repository.accounts[str(existing_account.id)] = existing_account
+        mock_repository.add(existing_account)
 
         # Tentar criar conta com mesmo nome
         with pytest.raises(AccountNameNotUniqueError):
@@ -200,6 +279,7 @@ class TestAccountCreation:
             )
 
 
+@pytest.mark.asyncio
 class TestAccountRetrieval:
     """Testes para busca de contas."""
 
@@ -209,16 +289,16 @@ class TestAccountRetrieval:
         assert accounts == []
 
     async def test_get_account_success(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve buscar conta específica com sucesso."""
-        account = Account(
+        account = make_account(
             user_id=user_id,
             name="Conta Teste",
             type=AccountType.CHECKING,
-            balance=Decimal("100.0"),
+            balance=_D100,
         )
-        mock_repository.accounts[str(account.id)] = account
+        mock_repository.add(account)
 
         result = await account_service.get_account(account.id, user_id)
         assert result.id == account.id
@@ -231,35 +311,41 @@ class TestAccountRetrieval:
             await account_service.get_account(fake_id, user_id)
 
     async def test_get_account_wrong_user(
-        self, account_service, user_id, other_user_id, mock_repository
+        self,
+        account_service,
+        user_id,
+        other_user_id,
+        mock_repository,
+        make_account,
     ):
         """Deve falhar ao buscar conta de outro usuário."""
-        account = Account(
+        account = make_account(
             user_id=other_user_id,
             name="Conta Outro User",
             type=AccountType.CHECKING,
-            balance=Decimal("100.0"),
+            balance=_D100,
         )
-        mock_repository.accounts[str(account.id)] = account
+        mock_repository.add(account)
 
         with pytest.raises(AccountNotFoundError):
             await account_service.get_account(account.id, user_id)
 
 
+@pytest.mark.asyncio
 class TestAccountUpdate:
     """Testes para atualização de contas."""
 
     async def test_update_account_name(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve atualizar nome da conta."""
-        account = Account(
+        account = make_account(
             user_id=user_id,
             name="Nome Antigo",
             type=AccountType.CHECKING,
-            balance=Decimal("100.0"),
+            balance=_D100,
         )
-        mock_repository.accounts[str(account.id)] = account
+        mock_repository.add(account)
 
         updated = await account_service.update_account(
             account_id=account.id, user_id=user_id, name="Nome Novo"
@@ -269,34 +355,34 @@ class TestAccountUpdate:
         assert updated.type == AccountType.CHECKING  # Mantém outros campos
 
     async def test_update_account_balance(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve atualizar saldo da conta."""
-        account = Account(
+        account = make_account(
             user_id=user_id,
             name="Conta Teste",
             type=AccountType.CHECKING,
-            balance=Decimal("100.0"),
+            balance=_D100,
         )
-        mock_repository.accounts[str(account.id)] = account
+        mock_repository.add(account)
 
         updated = await account_service.update_account(
             account_id=account.id, user_id=user_id, balance=250.50
         )
 
-        assert updated.balance == Decimal("250.50")
+        assert updated.balance == _D250_50
 
     async def test_update_account_invalid_balance(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve falhar ao definir saldo negativo inválido."""
-        account = Account(
+        account = make_account(
             user_id=user_id,
             name="Conta Corrente",
             type=AccountType.CHECKING,
-            balance=Decimal("100.0"),
+            balance=_D100,
         )
-        mock_repository.accounts[str(account.id)] = account
+        mock_repository.add(account)
 
         with pytest.raises(InvalidBalanceError):
             await account_service.update_account(
@@ -304,22 +390,22 @@ class TestAccountUpdate:
             )
 
 
+@pytest.mark.asyncio
 class TestAccountDeletion:
     """Testes para exclusão de contas."""
 
     async def test_delete_account_success(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve deletar conta quando há múltiplas contas."""
         # Criar duas contas
-        account1 = Account(
+        account1 = make_account(
             user_id=user_id, name="Conta 1", type=AccountType.CHECKING
         )
-        account2 = Account(
+        account2 = make_account(
             user_id=user_id, name="Conta 2", type=AccountType.SAVINGS
         )
-        mock_repository.accounts[str(account1.id)] = account1
-        mock_repository.accounts[str(account2.id)] = account2
+        mock_repository.bulk_insert([account1, account2])
 
         await account_service.delete_account(account1.id, user_id)
 
@@ -328,32 +414,33 @@ class TestAccountDeletion:
         assert mock_repository.delete_calls[0] == (account1.id, user_id)
 
     async def test_delete_last_account_fails(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve falhar ao tentar deletar última conta."""
-        account = Account(
+        account = make_account(
             user_id=user_id, name="Única Conta", type=AccountType.CHECKING
         )
-        mock_repository.accounts[str(account.id)] = account
+        mock_repository.add(account)
 
         with pytest.raises(CannotDeleteLastAccountError):
             await account_service.delete_account(account.id, user_id)
 
 
+@pytest.mark.asyncio
 class TestPrimaryAccount:
     """Testes para gestão de conta principal."""
 
     async def test_set_primary_account(
-        self, account_service, user_id, mock_repository
+        self, account_service, user_id, mock_repository, make_account
     ):
         """Deve definir conta como principal."""
-        account = Account(
+        account = make_account(
             user_id=user_id,
             name="Nova Principal",
             type=AccountType.CHECKING,
             is_primary=False,
         )
-        mock_repository.accounts[str(account.id)] = account
+        mock_repository.add(account)
 
         result = await account_service.set_primary_account(account.id, user_id)
 
@@ -366,3 +453,23 @@ class TestPrimaryAccount:
         fake_id = uuid4()
         with pytest.raises(AccountNotFoundError):
             await account_service.set_primary_account(fake_id, user_id)
+
+
+class TestCreateAccountRequestValidation:
+    """Testes de validação do schema de criação (sem passar pela API)."""
+
+    def test_invalid_type(self):
+        """Deve rejeitar tipo de conta inválido."""
+        with pytest.raises(ValidationError) as exc:
+            CreateAccountRequest(
+                name="Conta Inválida", type="invalid_type", balance=100.0
+            )
+
+        assert "type" in str(exc.value)
+
+    def test_blank_name(self):
+        """Deve rejeitar nome composto apenas por espaços."""
+        with pytest.raises(ValidationError) as exc:
+            CreateAccountRequest(name="   ", type=AccountType.CHECKING)
+
+        assert "Nome da conta não pode estar vazio" in str(exc.value)
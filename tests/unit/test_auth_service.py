@@ -1,6 +1,7 @@
 from datetime import datetime
 
 import pytest
+from pydantic import ValidationError
 
 from app.adapters.outbound.email_service import MockEmailService
 from app.adapters.outbound.jwt_service import JWTTokenService
@@ -17,24 +18,66 @@ from app.core.services.auth_service import (
 )
 
 
-@pytest.fixture
-def auth_service():
-    """Fixture para criar instância do serviço de autenticação."""
-    user_repo = InMemoryUserRepository()
-    password_reset_repo = InMemoryPasswordResetRepository()
-    token_service = JWTTokenService()
-    password_service = BcryptPasswordService()
-    email_service = MockEmailService()
+@pytest.fixture(scope="module")
+def user_repository():
+    """Fixture com o repositório de usuários compartilhado pelo módulo."""
+    return InMemoryUserRepository()
+
+
+@pytest.fixture(scope="module")
+def password_reset_repository():
+    """Fixture com o repositório de tokens de reset compartilhado."""
+    return InMemoryPasswordResetRepository()
+
+
+@pytest.fixture(scope="module")
+def jwt_service():
+    """Fixture com o serviço JWT compartilhado pelo módulo."""
+    return JWTTokenService()
+
+
+@pytest.fixture(scope="module")
+def password_service():
+    """Fixture com o serviço de senhas (custo mínimo do bcrypt)."""
+    return BcryptPasswordService(rounds=4)
+
 
+@pytest.fixture(scope="module")
+def email_service():
+    """Fixture com o serviço de e-mail mock (sem estado)."""
+    return MockEmailService()
+
+
+@pytest.fixture(scope="module")
+def auth_service(
+    user_repository,
+    password_reset_repository,
+    jwt_service,
+    password_service,
+    email_service,
+):
+    """
+    Fixture para criar instância do serviço de autenticação.
+
+    Criada uma única vez por módulo; o estado é limpo por
+    `reset_auth_repositories` antes de cada teste.
+    """
     return AuthService(
-        user_repository=user_repo,
-        password_reset_repository=password_reset_repo,
-        token_service=token_service,
+        user_repository=user_repository,
+        password_reset_repository=password_reset_repository,
+        token_service=jwt_service,
         password_service=password_service,
         email_service=email_service,
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_auth_repositories(user_repository, password_reset_repository):
+    """Limpa os repositórios em memória antes de cada teste."""
+    user_repository.clear()
+    password_reset_repository.clear()
+
+
 @pytest.fixture
 def valid_user_data():
     """Fixture com dados válidos de usuário."""
@@ -43,9 +86,63 @@ def valid_user_data():
     )
 
 
+@pytest.fixture(scope="module")
+def registered_user_data():
+    """Fixture com os dados do usuário pré-registrado do módulo."""
+    return UserCreate(
+        name="Maria Souza", email="maria@example.com", password="MinhaSenh@123"
+    )
+
+
+@pytest.fixture(scope="module")
+def registered_user_and_token(
+    auth_service, user_repository, registered_user_data, run_in_private_loop
+):
+    """
+    Fixture que registra e autentica o usuário uma única vez por módulo.
+
+    Retorna o usuário persistido e o token; a fixture `registered_user`
+    reinsere uma cópia dele a cada teste, já que os repositórios são
+    limpos antes de cada teste.
+    """
+
+    async def _register_and_login():
+        await auth_service.register_user(registered_user_data)
+        token = await auth_service.login_user(
+            UserLogin(
+                email=registered_user_data.email,
+                password=registered_user_data.password,
+            )
+        )
+        user = await user_repository.get_user_by_email(
+            registered_user_data.email
+        )
+        return user, token
+
+    return run_in_private_loop(_register_and_login())
+
+
+@pytest.fixture
+def registered_user(
+    reset_auth_repositories, user_repository, registered_user_and_token
+):
+    """Fixture que restaura o usuário pré-registrado (sem novo hash)."""
+    user, _ = registered_user_and_token
+    user_repository.add_user(user.model_copy(deep=True))
+    return user
+
+
+@pytest.fixture(scope="module")
+def sample_token(jwt_service):
+    """Fixture com um token já emitido para `user-123`."""
+    return jwt_service.create_access_token("user-123")
+
+
 class TestUserRegistration:
     """Testes para registro de usuário."""
 
+    @pytest.mark.slow
+    @pytest.mark.asyncio
     async def test_register_valid_user(self, auth_service, valid_user_data):
         """Deve registrar usuário com dados válidos."""
         user = await auth_service.register_user(valid_user_data)
@@ -55,6 +152,8 @@ class TestUserRegistration:
         assert user.id is not None
         assert isinstance(user.created_at, datetime)
 
+    @pytest.mark.slow
+    @pytest.mark.asyncio
     async def test_register_duplicate_email(
         self, auth_service, valid_user_data
     ):
@@ -76,19 +175,18 @@ class TestUserRegistration:
             )
 
 
+@pytest.mark.asyncio
 class TestUserLogin:
     """Testes para login de usuário."""
 
+    @pytest.mark.slow
     async def test_login_valid_credentials(
-        self, auth_service, valid_user_data
+        self, auth_service, registered_user, registered_user_data
     ):
         """Deve autenticar usuário com credenciais válidas."""
-        # Registra usuário
-        registered_user = await auth_service.register_user(valid_user_data)
-
-        # Faz login
         login_data = UserLogin(
-            email=valid_user_data.email, password=valid_user_data.password
+            email=registered_user_data.email,
+            password=registered_user_data.password,
         )
         token = await auth_service.login_user(login_data)
 
@@ -106,31 +204,27 @@ class TestUserLogin:
         with pytest.raises(AuthenticationError):
             await auth_service.login_user(login_data)
 
-    async def test_login_invalid_password(self, auth_service, valid_user_data):
+    @pytest.mark.slow
+    async def test_login_invalid_password(self, auth_service, registered_user):
         """Deve rejeitar login com senha incorreta."""
-        # Registra usuário
-        await auth_service.register_user(valid_user_data)
-
-        # Tenta login com senha incorreta
         login_data = UserLogin(
-            email=valid_user_data.email, password="SenhaErrada123"
+            email=registered_user.email, password="SenhaErrada123"
         )
 
         with pytest.raises(AuthenticationError):
             await auth_service.login_user(login_data)
 
 
+@pytest.mark.asyncio
 class TestTokenValidation:
     """Testes para validação de tokens."""
 
-    async def test_valid_token_extraction(self, auth_service, valid_user_data):
+    @pytest.mark.slow
+    async def test_valid_token_extraction(
+        self, auth_service, registered_user, registered_user_and_token
+    ):
         """Deve extrair usuário de token válido."""
-        # Registra e faz login
-        registered_user = await auth_service.register_user(valid_user_data)
-        login_data = UserLogin(
-            email=valid_user_data.email, password=valid_user_data.password
-        )
-        token = await auth_service.login_user(login_data)
+        _, token = registered_user_and_token
 
         # Valida token
         user = await auth_service.get_user_from_token(token.access_token)
@@ -150,12 +244,64 @@ class TestTokenValidation:
         assert user is None
 
 
+class TestUserCreateValidation:
+    """Testes de validação do schema de registro (sem passar pela API)."""
+
+    @pytest.mark.parametrize(
+        "password,message",
+        [
+            ("123", "pelo menos 8 caracteres"),
+            ("minhasenh@123", "letra maiúscula"),
+            ("MINHASENH@123", "letra minúscula"),
+            ("MinhaSenh@abc", "um número"),
+            ("MinhaSenha123", "caractere especial"),
+        ],
+    )
+    def test_invalid_password(self, password, message):
+        """Deve rejeitar senhas que não atendem aos critérios."""
+        with pytest.raises(ValidationError) as exc:
+            UserCreate(
+                name="João Silva",
+                email="joao@example.com",
+                password=password,
+            )
+
+        assert message in str(exc.value)
+
+    def test_invalid_email_format(self):
+        """Deve rejeitar e-mail com formato inválido."""
+        with pytest.raises(ValidationError) as exc:
+            UserCreate(
+                name="João Silva",
+                email="email-invalido",
+                password="MinhaSenh@123",
+            )
+
+        assert "email" in str(exc.value)
+
+
+@pytest.mark.asyncio
+class TestMockEmailService:
+    """Testes para o serviço de e-mail de desenvolvimento."""
+
+    async def test_send_password_reset_email(self, email_service, caplog):
+        """Deve registrar o envio em log e indicar sucesso."""
+        with caplog.at_level("INFO"):
+            sent = await email_service.send_password_reset_email(
+                "joao@example.com", "reset-token", "João Silva"
+            )
+
+        assert sent is True
+        assert "joao@example.com" in caplog.text
+        assert "reset-token" in caplog.text
+
+
 class TestPasswordServices:
     """Testes para serviços de senha."""
 
-    def test_password_hashing(self):
+    @pytest.mark.slow
+    def test_password_hashing(self, password_service):
         """Deve criar hash da senha corretamente."""
-        password_service = BcryptPasswordService()
         password = "MinhaSenh@123"
 
         hashed = password_service.hash_password(password)
@@ -164,9 +310,9 @@ class TestPasswordServices:
         assert len(hashed) > 0
         assert password_service.verify_password(password, hashed)
 
-    def test_password_verification_invalid(self):
+    @pytest.mark.slow
+    def test_password_verification_invalid(self, password_service):
         """Deve rejeitar senha incorreta."""
-        password_service = BcryptPasswordService()
         password = "MinhaSenh@123"
         wrong_password = "SenhaErrada"
 
@@ -174,32 +320,34 @@ class TestPasswordServices:
 
         assert not password_service.verify_password(wrong_password, hashed)
 
+    @pytest.mark.slow
+    def test_password_hashing_uses_configured_rounds(self):
+        """Deve gerar hash com o fator de custo informado."""
+        password_service = BcryptPasswordService(rounds=5)
+
+        hashed = password_service.hash_password("MinhaSenh@123")
+
+        assert hashed.startswith("$2b$05$")
+
 
 class TestJWTTokenService:
     """Testes para serviço de tokens JWT."""
 
-    def test_token_creation_and_verification(self):
+    def test_token_creation_and_verification(self, jwt_service, sample_token):
         """Deve criar e verificar token corretamente."""
-        token_service = JWTTokenService()
-        user_id = "user-123"
-
-        token = token_service.create_access_token(user_id)
-        verified_user_id = token_service.verify_token(token)
+        verified_user_id = jwt_service.verify_token(sample_token)
 
-        assert token is not None
-        assert verified_user_id == user_id
+        assert sample_token is not None
+        assert verified_user_id == "user-123"
 
-    def test_invalid_token_verification(self):
+    def test_invalid_token_verification(self, jwt_service):
         """Deve rejeitar token inválido."""
-        token_service = JWTTokenService()
-
-        result = token_service.verify_token("token-invalido")
+        result = jwt_service.verify_token("token-invalido")
         assert result is None
 
-    def test_token_expiration_time(self):
+    def test_token_expiration_time(self, jwt_service):
         """Deve retornar tempo de expiração correto."""
-        token_service = JWTTokenService()
-        expiration = token_service.get_token_expiration_time()
+        expiration = jwt_service.get_token_expiration_time()
 
         assert expiration > 0
         assert isinstance(expiration, int)
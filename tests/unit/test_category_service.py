@@ -0,0 +1,157 @@
+"""
+Testes unitários para CategoryServiceImpl.
+
+Valida a lógica de negócio para gestão de categorias.
+"""
+
+import pytest
+
+from app.core.domain.exceptions import (
+    CannotDeleteSystemCategoryError,
+    CategoryAlreadyExistsError,
+    CategoryNotFoundError,
+)
+from app.core.domain.transaction import (
+    Category,
+    CreateCategoryRequest,
+    TransactionType,
+)
+from app.core.services.transaction_service import CategoryServiceImpl
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("reset_repositories")
+class TestCategoryService:
+    """Testes para CategoryService."""
+
+    @pytest.fixture(scope="class")
+    def service(self, category_repo):
+        """Serviço de categorias compartilhado pela classe."""
+        return CategoryServiceImpl(
+            category_repository=category_repo,
+        )
+
+    async def test_create_category_success(self, service, user_uuid):
+        """Testa criação de categoria com sucesso."""
+        request = CreateCategoryRequest(
+            name="Food", type=TransactionType.EXPENSE
+        )
+
+        category = await service.create_category(
+            user_id=user_uuid,
+            name=request.name,
+            category_type=request.type,
+        )
+
+        assert category.user_id == user_uuid
+        assert category.name == "Food"
+        assert category.type == TransactionType.EXPENSE
+        assert not category.is_system
+
+    async def test_create_category_duplicate_name(self, service, user_uuid):
+        """Testa criação de categoria com nome duplicado."""
+        request = CreateCategoryRequest(
+            name="Food", type=TransactionType.EXPENSE
+        )
+
+        await service.create_category(
+            user_id=user_uuid,
+            name=request.name,
+            category_type=request.type,
+        )
+
+        with pytest.raises(CategoryAlreadyExistsError):
+            await service.create_category(
+                user_id=user_uuid,
+                name=request.name,
+                category_type=request.type,
+            )
+
+    async def test_get_user_categories(
+        self, service, user_uuid, category_repo
+    ):
+        """Testa busca de categorias do usuário."""
+        await service.create_category(
+            user_id=user_uuid,
+            name="Food",
+            category_type=TransactionType.EXPENSE,
+        )
+
+        system_category = Category.create_system_category(
+            "Salary", TransactionType.INCOME
+        )
+        await category_repo.create(system_category)
+
+        categories = await service.list_categories(user_uuid)
+
+        assert len(categories) == 2
+        user_categories = [c for c in categories if not c.is_system]
+        system_categories = [c for c in categories if c.is_system]
+
+        assert len(user_categories) == 1
+        assert len(system_categories) == 1
+
+    async def test_delete_category_success(self, service, user_uuid):
+        """Testa exclusão de categoria do usuário."""
+        request = CreateCategoryRequest(
+            name="To Delete", type=TransactionType.EXPENSE
+        )
+
+        category = await service.create_category(
+            user_id=user_uuid,
+            name=request.name,
+            category_type=request.type,
+        )
+
+        await service.delete_category(category.id, user_uuid)
+
+        with pytest.raises(CategoryNotFoundError):
+            await service.get_category_by_id(category.id, user_uuid)
+
+    async def test_recreate_category_after_delete(self, service, user_uuid):
+        """Testa que nome de categoria excluída pode ser reutilizado."""
+        category = await service.create_category(
+            user_id=user_uuid,
+            name="Food",
+            category_type=TransactionType.EXPENSE,
+        )
+        await service.delete_category(category.id, user_uuid)
+
+        recreated = await service.create_category(
+            user_id=user_uuid,
+            name="food",
+            category_type=TransactionType.EXPENSE,
+        )
+
+        assert recreated.id != category.id
+
+    async def test_recreate_category_after_repository_cleared(
+        self, service, user_uuid, category_repo
+    ):
+        """Testa que o índice de nomes não sobrevive ao repositório."""
+        await service.create_category(
+            user_id=user_uuid,
+            name="Food",
+            category_type=TransactionType.EXPENSE,
+        )
+        category_repo.clear()
+
+        recreated = await service.create_category(
+            user_id=user_uuid,
+            name="Food",
+            category_type=TransactionType.EXPENSE,
+        )
+
+        assert recreated.name == "Food"
+
+    async def test_delete_system_category_fails(
+        self, service, user_uuid, category_repo
+    ):
+        """Testa que não é possível excluir categoria do sistema."""
+        category = Category.create_system_category(
+            "System Category", TransactionType.INCOME
+        )
+        await category_repo.create(category)
+
+        with pytest.raises(CannotDeleteSystemCategoryError):
+            await service.delete_category(category.id, user_uuid)
@@ -4,9 +4,12 @@ Testes unitários para os serviços de dashboard.
 Testa a lógica de negócio dos serviços de analytics e dashboard.
 """
 
+import asyncio
+import copy
 from datetime import datetime, timedelta
 from decimal import Decimal
-from uuid import uuid4
+from itertools import count
+from uuid import UUID
 
 import pytest
 
@@ -19,7 +22,9 @@ from app.core.domain.account import Account, AccountType
 from app.core.domain.dashboard import (
     BalanceEvolutionFilter,
     ExpensesCategoryFilter,
+    FinancialIndicator,
     PeriodFilter,
+    Suggestion,
 )
 from app.core.domain.transaction import Category, Transaction, TransactionType
 from app.core.services.dashboard_service import (
@@ -27,11 +32,42 @@ from app.core.services.dashboard_service import (
     FinancialAnalyticsServiceImpl,
 )
 
+# Mantém os testes de dashboard no mesmo worker do xdist (--dist=loadgroup),
+# reaproveitando as fixtures de sessão, enquanto os demais arquivos são
+# distribuídos teste a teste.
+pytestmark = pytest.mark.xdist_group("dashboard")
 
-@pytest.fixture
-def user_id():
+
+@pytest.fixture(scope="session")
+def uuid_pool():
+    """Fixture com UUIDs determinísticos (falhas reproduzíveis)."""
+    return [UUID(int=i) for i in range(1, 1025)]
+
+
+@pytest.fixture(scope="session")
+def next_uuid(uuid_pool):
+    """Fixture que entrega o próximo UUID do pool."""
+    counter = count()
+    return lambda: uuid_pool[next(counter)]
+
+
+@pytest.fixture(scope="session")
+def clock_now():
+    """
+    Fixture com o instante de referência da sessão, lido uma única vez.
+
+    Usa o relógio real (e não uma data fixa) porque os serviços ainda
+    consultam `datetime.now()` internamente, p. ex. no score de saúde. O
+    nome difere de `now` (data fixa, em tests/unit/conftest.py) para não
+    sobrepor aquela fixture.
+    """
+    return datetime.now()
+
+
+@pytest.fixture(scope="session")
+def user_id(next_uuid):
     """Fixture que retorna um ID de usuário para testes."""
-    return uuid4()
+    return next_uuid()
 
 
 @pytest.fixture
@@ -76,11 +112,10 @@ def dashboard_service(
     )
 
 
-@pytest.fixture
-async def sample_accounts(account_repository, user_id):
-    """Fixture que cria contas de exemplo."""
+def _build_sample_data(user_id, next_uuid, clock_now):
+    """Monta as contas, categorias e transações de exemplo."""
     account1 = Account(
-        id=uuid4(),
+        id=next_uuid(),
         user_id=user_id,
         name="Conta Corrente",
         type=AccountType.CHECKING,
@@ -90,7 +125,7 @@ async def sample_accounts(account_repository, user_id):
     )
 
     account2 = Account(
-        id=uuid4(),
+        id=next_uuid(),
         user_id=user_id,
         name="Poupança",
         type=AccountType.SAVINGS,
@@ -99,104 +134,154 @@ async def sample_accounts(account_repository, user_id):
         is_primary=False,
     )
 
-    await account_repository.create(account1)
-    await account_repository.create(account2)
-
-    return [account1, account2]
-
-
-@pytest.fixture
-async def sample_categories(category_repository, user_id):
-    """Fixture que cria categorias de exemplo."""
-    category1 = Category(
-        id=uuid4(),
+    cat_food = Category(
+        id=next_uuid(),
         user_id=user_id,
         name="Alimentação",
         type=TransactionType.EXPENSE,
     )
 
-    category2 = Category(
-        id=uuid4(),
+    cat_transport = Category(
+        id=next_uuid(),
         user_id=user_id,
         name="Transporte",
         type=TransactionType.EXPENSE,
     )
 
-    category3 = Category(
-        id=uuid4(),
+    cat_salary = Category(
+        id=next_uuid(),
         user_id=user_id,
         name="Salário",
         type=TransactionType.INCOME,
     )
 
-    await category_repository.create(category1)
-    await category_repository.create(category2)
-    await category_repository.create(category3)
-
-    return [category1, category2, category3]
-
-
-@pytest.fixture
-async def sample_transactions(
-    transaction_repository, user_id, sample_accounts, sample_categories
-):
-    """Fixture que cria transações de exemplo."""
-    account1, account2 = sample_accounts
-    cat_food, cat_transport, cat_salary = sample_categories
-
-    now = datetime.now()
-
     transactions = [
         # Receitas
         Transaction(
-            id=uuid4(),
+            id=next_uuid(),
             user_id=user_id,
             account_id=account1.id,
             category_id=cat_salary.id,
             type=TransactionType.INCOME,
             amount=Decimal("3000.00"),
             description="Salário",
-            date=now - timedelta(days=5),
+            date=clock_now - timedelta(days=5),
         ),
         # Despesas
         Transaction(
-            id=uuid4(),
+            id=next_uuid(),
             user_id=user_id,
             account_id=account1.id,
             category_id=cat_food.id,
             type=TransactionType.EXPENSE,
             amount=Decimal("150.00"),
             description="Supermercado",
-            date=now - timedelta(days=3),
+            date=clock_now - timedelta(days=3),
         ),
         Transaction(
-            id=uuid4(),
+            id=next_uuid(),
             user_id=user_id,
             account_id=account1.id,
             category_id=cat_transport.id,
             type=TransactionType.EXPENSE,
             amount=Decimal("80.00"),
             description="Combustível",
-            date=now - timedelta(days=2),
+            date=clock_now - timedelta(days=2),
         ),
         Transaction(
-            id=uuid4(),
+            id=next_uuid(),
             user_id=user_id,
             account_id=account2.id,
             category_id=cat_food.id,
             type=TransactionType.EXPENSE,
             amount=Decimal("200.00"),
             description="Restaurante",
-            date=now - timedelta(days=1),
+            date=clock_now - timedelta(days=1),
         ),
     ]
 
-    for transaction in transactions:
-        await transaction_repository.create(transaction)
+    return (
+        [account1, account2],
+        [cat_food, cat_transport, cat_salary],
+        transactions,
+    )
+
+
+def _copy_into(repository, template, items):
+    """Copia o estado do repositório-modelo e devolve as cópias dos itens."""
+    state, copies = copy.deepcopy((vars(template), items))
+    vars(repository).update(state)
+    return copies
+
+
+@pytest.fixture(scope="session")
+def populated_state(user_id, next_uuid, clock_now, run_in_private_loop):
+    """
+    Monta uma única vez os repositórios com os dados de exemplo.
 
-    return transactions
+    As fixtures `sample_*` copiam este estado para os repositórios de
+    cada teste, sem repetir os `create`.
 
+    Returns:
+        dict: Pares (repositório-modelo, itens) por tipo de dado
+    """
+    accounts, categories, transactions = _build_sample_data(
+        user_id, next_uuid, clock_now
+    )
+    state = {
+        "accounts": (InMemoryAccountRepository(), accounts),
+        "categories": (InMemoryCategoryRepository(), categories),
+        "transactions": (InMemoryTransactionRepository(), transactions),
+        "expense_transactions": (
+            InMemoryTransactionRepository(),
+            [t for t in transactions if t.type == TransactionType.EXPENSE],
+        ),
+    }
+
+    async def _populate():
+        await asyncio.gather(
+            *(
+                repository.create_many(items)
+                for repository, items in state.values()
+            )
+        )
+
+    run_in_private_loop(_populate())
+
+    return state
+
+
+@pytest.fixture
+def sample_accounts(account_repository, populated_state):
+    """Fixture que cria contas de exemplo."""
+    return _copy_into(account_repository, *populated_state["accounts"])
+
+
+@pytest.fixture
+def sample_categories(category_repository, populated_state):
+    """Fixture que cria categorias de exemplo."""
+    return _copy_into(category_repository, *populated_state["categories"])
 
+
+@pytest.fixture
+def sample_transactions(
+    transaction_repository, sample_accounts, sample_categories, populated_state
+):
+    """Fixture que cria transações de exemplo."""
+    return _copy_into(transaction_repository, *populated_state["transactions"])
+
+
+@pytest.fixture
+def sample_expense_txs(
+    transaction_repository, sample_accounts, sample_categories, populated_state
+):
+    """Fixture que cria apenas as despesas de exemplo."""
+    return _copy_into(
+        transaction_repository, *populated_state["expense_transactions"]
+    )
+
+
+@pytest.mark.asyncio
 class TestDashboardService:
     """Testes do serviço principal de dashboard."""
 
@@ -213,12 +298,11 @@ class TestDashboardService:
         assert result.last_updated is not None
 
     async def test_get_dashboard_summary(
-        self, dashboard_service, user_id, sample_transactions
+        self, dashboard_service, user_id, sample_transactions, clock_now
     ):
         """Testa o resumo financeiro do período."""
-        now = datetime.now()
         period_filter = PeriodFilter(
-            start_date=now - timedelta(days=30), end_date=now
+            start_date=clock_now - timedelta(days=30), end_date=clock_now
         )
 
         result = await dashboard_service.get_dashboard_summary(
@@ -231,15 +315,16 @@ class TestDashboardService:
         assert result.total_transactions == 4
         assert result.income_transactions == 1
         assert result.expense_transactions == 3
+        assert result.highest_income == Decimal("3000.00")
+        assert result.highest_expense == Decimal("200.00")
 
     async def test_get_dashboard_expenses_by_category(
-        self, dashboard_service, user_id, sample_transactions
+        self, dashboard_service, user_id, sample_expense_txs, clock_now
     ):
         """Testa a distribuição de despesas por categoria."""
-        now = datetime.now()
         category_filter = ExpensesCategoryFilter(
-            start_date=now - timedelta(days=30),
-            end_date=now,
+            start_date=clock_now - timedelta(days=30),
+            end_date=clock_now,
             limit=10,
             include_others=True,
         )
@@ -265,13 +350,12 @@ class TestDashboardService:
                 assert food_category.total_amount == Decimal("350.00")
 
     async def test_get_dashboard_balance_evolution(
-        self, dashboard_service, user_id, sample_accounts
+        self, dashboard_service, user_id, sample_accounts, clock_now
     ):
         """Testa a evolução temporal dos saldos."""
-        now = datetime.now()
         evolution_filter = BalanceEvolutionFilter(
-            end_date=now,
-            start_date=now - timedelta(days=365),
+            end_date=clock_now,
+            start_date=clock_now - timedelta(days=365),
             granularity="monthly",
             months_back=12,
         )
@@ -315,6 +399,7 @@ class TestDashboardService:
         assert isinstance(result.suggestions, list)
 
 
+@pytest.mark.asyncio
 class TestFinancialAnalyticsService:
     """Testes do serviço de analytics financeiros."""
 
@@ -340,10 +425,7 @@ class TestFinancialAnalyticsService:
         assert isinstance(indicators, list)
 
         if indicators:
-            indicator = indicators[0]
-            assert hasattr(indicator, "name")
-            assert hasattr(indicator, "value")
-            assert hasattr(indicator, "status")
+            assert isinstance(indicators[0], FinancialIndicator)
 
     async def test_detect_alerts(
         self, analytics_service, user_id, sample_accounts
@@ -362,11 +444,10 @@ class TestFinancialAnalyticsService:
         assert isinstance(suggestions, list)
 
         if suggestions:
-            suggestion = suggestions[0]
-            assert hasattr(suggestion, "title")
-            assert hasattr(suggestion, "description")
+            assert isinstance(suggestions[0], Suggestion)
 
 
+@pytest.mark.asyncio
 class TestDashboardEdgeCases:
     """Testes de casos extremos do dashboard."""
 
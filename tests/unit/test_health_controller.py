@@ -4,32 +4,40 @@ Testes unitários para o health check controller.
 Testa o funcionamento dos endpoints de verificação de saúde da aplicação.
 """
 
+import pytest
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(scope="module")
+def health_payload(client: TestClient):
+    """
+    Fixture com a resposta de /health, obtida uma única vez por módulo.
+
+    Returns:
+        dict: Corpo JSON retornado pelo health check básico
+    """
+    response = client.get("/health")
+    assert response.status_code == 200
+    return response.json()
+
+
 class TestHealthController:
     """Testes para os endpoints de health check."""
 
-    def test_basic_health_check(self, client: TestClient):
+    def test_basic_health_check(self, health_payload):
         """
         Testa o endpoint básico de health check.
 
         Verifica se:
-        - Retorna status code 200
         - Retorna status "OK"
         - Contém informações básicas da aplicação
         """
-        response = client.get("/health")
-
-        assert response.status_code == 200
-
-        data = response.json()
-        assert data["status"] == "OK"
-        assert "service" in data
-        assert "version" in data
-        assert "environment" in data
-        assert "timestamp" in data
-        assert "uptime" in data
+        assert health_payload["status"] == "OK"
+        assert "service" in health_payload
+        assert "version" in health_payload
+        assert "environment" in health_payload
+        assert "timestamp" in health_payload
+        assert "uptime" in health_payload
 
     def test_detailed_health_check(self, client: TestClient):
         """
@@ -65,22 +73,26 @@ class TestHealthController:
         assert "cors_origins" in data["configuration"]
         assert "log_level" in data["configuration"]
 
-    def test_health_check_response_format(self, client: TestClient):
+    @pytest.mark.parametrize(
+        "field,expected_type",
+        [
+            ("status", str),
+            ("service", str),
+            ("version", str),
+            ("environment", str),
+            ("timestamp", str),
+            ("uptime", str),
+        ],
+    )
+    def test_health_check_response_format(
+        self, health_payload, field, expected_type
+    ):
         """
         Testa o formato da resposta do health check.
 
         Verifica se os campos têm os tipos corretos.
         """
-        response = client.get("/health")
-        data = response.json()
-
-        # Verificar tipos dos campos
-        assert isinstance(data["status"], str)
-        assert isinstance(data["service"], str)
-        assert isinstance(data["version"], str)
-        assert isinstance(data["environment"], str)
-        assert isinstance(data["timestamp"], str)
-        assert isinstance(data["uptime"], str)
+        assert isinstance(health_payload[field], expected_type)
 
     def test_detailed_health_check_structure(self, client: TestClient):
         """
@@ -111,16 +123,12 @@ class TestHealthController:
         assert isinstance(config["cors_origins"], list)
         assert isinstance(config["log_level"], str)
 
-    def test_health_endpoints_are_public(self, client: TestClient):
+    @pytest.mark.parametrize("path", ["/health", "/health/detailed"])
+    def test_health_endpoints_are_public(self, client: TestClient, path):
         """
         Verifica se os endpoints de health check são públicos.
 
         Os endpoints de health check não devem requerer autenticação.
         """
-        # Endpoint básico
-        response = client.get("/health")
-        assert response.status_code == 200
-
-        # Endpoint detalhado
-        response = client.get("/health/detailed")
+        response = client.get(path)
         assert response.status_code == 200
@@ -12,16 +12,22 @@ import pytest
 from app.config import Settings, get_settings
 
 
+@pytest.fixture(scope="module")
+def default_settings():
+    """Fixture com uma instância padrão de Settings, criada uma única vez."""
+    return Settings()
+
+
 class TestSettings:
     """Testes para a classe Settings."""
 
-    def test_default_settings(self):
+    def test_default_settings(self, default_settings):
         """
         Testa as configurações padrão.
 
         Verifica se os valores padrão estão corretos.
         """
-        settings = Settings()
+        settings = default_settings
 
         assert settings.environment == "dev"
         assert settings.debug is True
@@ -33,47 +39,47 @@ class TestSettings:
         assert settings.algorithm == "HS256"
         assert settings.access_token_expire_minutes == 30
 
-    def test_mongodb_url_with_db_property(self):
+    def test_mongodb_url_with_db_property(self, default_settings):
         """
         Testa a propriedade mongodb_url_with_db.
 
         Verifica se a URL completa é construída corretamente.
         """
-        settings = Settings()
+        settings = default_settings
         expected_url = f"{settings.mongodb_url}/{settings.mongodb_database}"
         assert settings.mongodb_url_with_db == expected_url
 
-    def test_test_mongodb_url_with_db_property(self):
+    def test_test_mongodb_url_with_db_property(self, default_settings):
         """
         Testa a propriedade test_mongodb_url_with_db.
 
         Verifica se a URL de teste é construída corretamente.
         """
-        settings = Settings()
+        settings = default_settings
         expected_url = f"{
             settings.test_mongodb_url}/{settings.test_mongodb_database}"
         assert settings.test_mongodb_url_with_db == expected_url
 
-    def test_environment_detection_methods(self):
+    def test_environment_detection_methods(self, default_settings):
         """
         Testa os métodos de detecção de ambiente.
 
         Verifica se os métodos identificam corretamente o ambiente.
         """
         # Ambiente de desenvolvimento
-        settings = Settings(environment="dev")
+        settings = default_settings.model_copy(update={"environment": "dev"})
         assert settings.is_development() is True
         assert settings.is_production() is False
         assert settings.is_testing() is False
 
         # Ambiente de produção
-        settings = Settings(environment="prod")
+        settings = default_settings.model_copy(update={"environment": "prod"})
         assert settings.is_development() is False
         assert settings.is_production() is True
         assert settings.is_testing() is False
 
         # Ambiente de teste
-        settings = Settings(environment="test")
+        settings = default_settings.model_copy(update={"environment": "test"})
         assert settings.is_development() is False
         assert settings.is_production() is False
         assert settings.is_testing() is True
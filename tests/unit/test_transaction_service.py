@@ -1,288 +1,167 @@
 """
-Testes unitários para TransactionServiceImpl e CategoryServiceImpl.
+Testes unitários para TransactionServiceImpl.
 
-Valida a lógica de negócio para gestão de transações e categorias.
+Valida a lógica de negócio para gestão de transações.
 """
 
+from contextlib import nullcontext
 from datetime import datetime
 from decimal import Decimal
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 import pytest
 
-from app.adapters.outbound.memory_repositories import (
-    InMemoryAccountRepository,
-    InMemoryCategoryRepository,
-    InMemoryTransactionRepository,
-    InMemoryUserRepository,
-)
-from app.core.domain.account import Account, AccountType
 from app.core.domain.exceptions import (
     AccountNotFoundError,
-    CannotDeleteSystemCategoryError,
-    CategoryAlreadyExistsError,
     CategoryNotFoundError,
     TransactionNotFoundError,
 )
 from app.core.domain.transaction import (
-    Category,
-    CreateCategoryRequest,
     CreateTransactionRequest,
     RecurrenceType,
     TransactionType,
 )
-from app.core.domain.user import User
-from app.core.services.transaction_service import (
-    CategoryServiceImpl,
-    TransactionServiceImpl,
-)
-
 
+# Variações de criação: campos sobrescritos e exceção esperada.
+_CREATE_CASES = [
+    pytest.param({}, None, id="success"),
+    pytest.param(
+        {"is_recurring": True, "recurrence_frequency": RecurrenceType.MONTHLY},
+        None,
+        id="recurring",
+    ),
+    pytest.param(
+        {"account_id": uuid4()}, AccountNotFoundError, id="account_not_found"
+    ),
+    pytest.param(
+        {"category_id": uuid4()},
+        CategoryNotFoundError,
+        id="category_not_found",
+    ),
+]
+
+
+def _create_request(**fields):
+    """Monta um CreateTransactionRequest de receita, validado pelo schema."""
+    data = {
+        "type": TransactionType.INCOME,
+        "amount": Decimal("100.50"),
+        "description": "Test transaction",
+        **fields,
+    }
+    return CreateTransactionRequest(**data)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("reset_repositories")
 class TestTransactionService:
     """Testes para TransactionService."""
 
-    @pytest.fixture
-    def user(self):
-        """Usuário de teste."""
-        now = datetime.utcnow()
-        return User(
-            id=str(uuid4()),
-            name="Test User",
-            email="test@example.com",
-            password_hash="Hashed_password1@",
-            created_at=now,
-            updated_at=now,
-            is_active=True,
-        )
-
-    @pytest.fixture
-    def account(self, user):
-        """Conta de teste."""
-        return Account(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Test Account",
-            type=AccountType.CHECKING,
-            balance=Decimal("0.00"),
-        )
-
-    @pytest.fixture
-    def category(self, user):
-        """Categoria de teste."""
-        return Category(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Test Category",
-            type=TransactionType.EXPENSE,
-        )
-
-    @pytest.fixture
-    def transaction_repo(self):
-        """Repositório de transações em memória."""
-        return InMemoryTransactionRepository()
-
-    @pytest.fixture
-    def category_repo(self):
-        """Repositório de categorias em memória."""
-        return InMemoryCategoryRepository()
-
-    @pytest.fixture
-    def account_repo(self):
-        """Repositório de contas em memória."""
-        return InMemoryAccountRepository()
-
-    @pytest.fixture
-    async def user_repo(self, user):
-        """Repositório de usuários em memória."""
-        repo = InMemoryUserRepository()
-        return repo
-
-    @pytest.fixture
-    def service(
-        self, transaction_repo, category_repo, account_repo, user_repo
+    @pytest.mark.parametrize("overrides,expected_exc", _CREATE_CASES)
+    async def test_create_transaction(
+        self,
+        service,
+        seed,
+        user_uuid,
+        make_account,
+        make_category,
+        overrides,
+        expected_exc,
+        now,
     ):
-        """Serviço de transações."""
-        return TransactionServiceImpl(
-            transaction_repository=transaction_repo,
-            category_repository=category_repo,
-            account_repository=account_repo,
-        )
-
-    async def test_create_transaction_success(
-        self, service, user, account, category, category_repo
-    ):
-        """Testa criação de transação com sucesso."""
-        category.type = TransactionType.INCOME
-        await category_repo.create(category)
-        await service._account_repo.create(account)
-
-        request = CreateTransactionRequest(
-            account_id=account.id,
-            category_id=category.id,
-            type=TransactionType.INCOME,
-            amount=Decimal("100.50"),
-            description="Test transaction",
-            date=datetime.utcnow(),
-        )
-
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=request.account_id,
-            category_id=request.category_id,
-            transaction_type=request.type,
-            amount=float(request.amount),
-            description=request.description,
-            date=request.date,
-            is_recurring=request.is_recurring,
-            recurrence_frequency=(
-                request.recurrence_frequency.value
-                if request.recurrence_frequency
-                else None
-            ),
-        )
-
-        assert transaction.user_id == UUID(user.id)
-        assert transaction.account_id == account.id
-        assert transaction.category_id == category.id
-        assert transaction.amount == Decimal("100.50")
-        assert transaction.description == "Test transaction"
-        assert not transaction.is_recurring
-
-    async def test_create_recurring_transaction(
-        self, service, user, account, category, category_repo
-    ):
-        """Testa criação de transação recorrente."""
-        income_category = Category(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Salary Category",
-            type=TransactionType.INCOME,
-        )
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
-        request = CreateTransactionRequest(
-            account_id=account.id,
-            category_id=income_category.id,
-            type=TransactionType.INCOME,
-            amount=Decimal("2000.00"),
-            description="Salary",
-            date=datetime.utcnow(),
-            is_recurring=True,
-            recurrence_frequency=RecurrenceType.MONTHLY,
-        )
-
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=request.account_id,
-            category_id=request.category_id,
-            transaction_type=request.type,
-            amount=float(request.amount),
-            description=request.description,
-            date=request.date,
-            is_recurring=request.is_recurring,
-            recurrence_frequency=(
-                request.recurrence_frequency.value
-                if request.recurrence_frequency
-                else None
-            ),
-        )
-
-        assert transaction.is_recurring
-        assert transaction.recurrence_frequency == RecurrenceType.MONTHLY
-
-    async def test_create_transaction_account_not_found(
-        self, service, user, category, category_repo
-    ):
-        """Testa criação de transação com conta inexistente."""
-        await category_repo.create(category)
-
-        request = CreateTransactionRequest(
-            account_id=uuid4(),
-            category_id=category.id,
-            type=TransactionType.EXPENSE,
-            amount=Decimal("100.00"),
-            description="Test",
-            date=datetime.utcnow(),
-        )
-
-        with pytest.raises(AccountNotFoundError):
-            await service.create_transaction(
-                user_id=UUID(user.id),
+        """Testa criação de transação: sucesso, recorrência e erros."""
+        account = make_account()
+        category = make_category(type=TransactionType.INCOME)
+        await seed(accounts=[account], categories=[category])
+        ids = {
+            "account_id": account.id,
+            "category_id": category.id,
+            "date": now,
+        }
+        request = _create_request(**(ids | overrides))
+
+        with pytest.raises(expected_exc) if expected_exc else nullcontext():
+            transaction = await service.create_transaction(
+                user_id=user_uuid,
                 account_id=request.account_id,
                 category_id=request.category_id,
                 transaction_type=request.type,
                 amount=float(request.amount),
                 description=request.description,
                 date=request.date,
+                is_recurring=request.is_recurring,
+                recurrence_frequency=(
+                    request.recurrence_frequency.value
+                    if request.recurrence_frequency
+                    else None
+                ),
             )
+        if expected_exc:
+            return
+
+        assert transaction.user_id == user_uuid
+        assert transaction.account_id == account.id
+        assert transaction.category_id == category.id
+        assert transaction.amount == Decimal("100.50")
+        assert transaction.description == "Test transaction"
+        assert transaction.is_recurring is request.is_recurring
+        assert transaction.recurrence_frequency == request.recurrence_frequency
 
-    async def test_create_transaction_category_not_found(
-        self, service, user, account
+    async def test_create_transaction_invalid_frequency(
+        self, service, seed, user_uuid, make_account, make_category, now
     ):
-        """Testa criação de transação com categoria inexistente."""
-        await service._account_repo.create(account)
-        request = CreateTransactionRequest(
-            account_id=account.id,
-            category_id=uuid4(),
-            type=TransactionType.EXPENSE,
-            amount=Decimal("100.00"),
-            description="Test",
-            date=datetime.utcnow(),
-        )
+        """Testa criação de transação com frequência inválida."""
+        account = make_account()
+        category = make_category()
+        await seed(accounts=[account], categories=[category])
 
-        with pytest.raises(CategoryNotFoundError):
+        with pytest.raises(ValueError, match="Frequência inválida"):
             await service.create_transaction(
-                user_id=UUID(user.id),
-                account_id=request.account_id,
-                category_id=request.category_id,
-                transaction_type=request.type,
-                amount=float(request.amount),
-                description=request.description,
-                date=request.date,
+                user_id=user_uuid,
+                account_id=account.id,
+                category_id=category.id,
+                transaction_type=TransactionType.EXPENSE,
+                amount=100.0,
+                description="Test",
+                date=now,
+                is_recurring=True,
+                recurrence_frequency="daily",
             )
 
     async def test_get_user_transactions(
-        self, service, user, account, category, category_repo
+        self, service, seed, user_uuid, make_account, make_category, now
     ):
         """Testa busca de transações do usuário."""
-        income_category_1 = Category(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Income Category 1",
-            type=TransactionType.INCOME,
+        account = make_account()
+        income_category_1 = make_category(
+            name="Income Category 1", type=TransactionType.INCOME
+        )
+        expense_category = make_category(name="Expense Category")
+        await seed(
+            accounts=[account],
+            categories=[income_category_1, expense_category],
         )
-        await category_repo.create(income_category_1)
-        await service._account_repo.create(account)
 
         request1 = CreateTransactionRequest(
             account_id=account.id,
             category_id=income_category_1.id,
             type=TransactionType.INCOME,
-            amount=Decimal("50.00"),
+            amount=50.0,
             description="Transaction 1",
-            date=datetime.utcnow(),
-        )
-
-        expense_category = Category(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Expense Category",
-            type=TransactionType.EXPENSE,
+            date=now,
         )
-        await category_repo.create(expense_category)
 
         request2 = CreateTransactionRequest(
             account_id=account.id,
             category_id=expense_category.id,
             type=TransactionType.EXPENSE,
-            amount=Decimal("30.00"),
+            amount=30.0,
             description="Transaction 2",
-            date=datetime.utcnow(),
+            date=now,
         )
 
         await service.create_transaction(
-            user_id=UUID(user.id),
+            user_id=user_uuid,
             account_id=request1.account_id,
             category_id=request1.category_id,
             transaction_type=request1.type,
@@ -291,7 +170,7 @@ class TestTransactionService:
             date=request1.date,
         )
         await service.create_transaction(
-            user_id=UUID(user.id),
+            user_id=user_uuid,
             account_id=request2.account_id,
             category_id=request2.category_id,
             transaction_type=request2.type,
@@ -300,160 +179,48 @@ class TestTransactionService:
             date=request2.date,
         )
 
-        transactions = await service.list_transactions(UUID(user.id))
+        transactions = await service.list_transactions(user_uuid)
         assert len(transactions) == 2
 
-    async def test_delete_transaction(
-        self, service, user, account, category, category_repo
+    async def test_duplicate_transaction(
+        self,
+        service,
+        seed,
+        user_uuid,
+        make_account,
+        make_category,
+        account_repo,
     ):
-        """Testa exclusão de transação."""
-        category.type = TransactionType.INCOME
-        await category_repo.create(category)
-        await service._account_repo.create(account)
+        """Testa duplicação de transação com nova data."""
+        account = make_account()
+        category = make_category(type=TransactionType.INCOME)
+        await seed(accounts=[account], categories=[category])
 
-        request = CreateTransactionRequest(
+        original = await service.create_transaction(
+            user_id=user_uuid,
             account_id=account.id,
             category_id=category.id,
-            type=TransactionType.INCOME,
-            amount=Decimal("100.00"),
-            description="To be deleted",
-            date=datetime.utcnow(),
-        )
-
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=request.account_id,
-            category_id=request.category_id,
-            transaction_type=request.type,
-            amount=float(request.amount),
-            description=request.description,
-            date=request.date,
-        )
-
-        await service.delete_transaction(transaction.id, UUID(user.id))
-
-        with pytest.raises(TransactionNotFoundError):
-            await service.get_transaction_by_id(transaction.id, UUID(user.id))
-
-
-class TestCategoryService:
-    """Testes para CategoryService."""
-
-    @pytest.fixture
-    def user(self):
-        """Usuário de teste."""
-        now = datetime.utcnow()
-        return User(
-            id=str(uuid4()),
-            name="Test User",
-            email="test@example.com",
-            password_hash="Hashed_password1@",
-            created_at=now,
-            updated_at=now,
-            is_active=True,
-        )
-
-    @pytest.fixture
-    def category_repo(self):
-        """Repositório de categorias em memória."""
-        return InMemoryCategoryRepository()
-
-    @pytest.fixture
-    async def user_repo(self, user):
-        """Repositório de usuários em memória."""
-        repo = InMemoryUserRepository()
-        return repo
-
-    @pytest.fixture
-    def service(self, category_repo):
-        """Serviço de categorias."""
-        return CategoryServiceImpl(
-            category_repository=category_repo,
-        )
-
-    async def test_create_category_success(self, service, user):
-        """Testa criação de categoria com sucesso."""
-        request = CreateCategoryRequest(
-            name="Food", type=TransactionType.EXPENSE
-        )
-
-        category = await service.create_category(
-            user_id=UUID(user.id),
-            name=request.name,
-            category_type=request.type,
-        )
-
-        assert category.user_id == UUID(user.id)
-        assert category.name == "Food"
-        assert category.type == TransactionType.EXPENSE
-        assert not category.is_system
-
-    async def test_create_category_duplicate_name(self, service, user):
-        """Testa criação de categoria com nome duplicado."""
-        request = CreateCategoryRequest(
-            name="Food", type=TransactionType.EXPENSE
-        )
-
-        await service.create_category(
-            user_id=UUID(user.id),
-            name=request.name,
-            category_type=request.type,
-        )
-
-        with pytest.raises(CategoryAlreadyExistsError):
-            await service.create_category(
-                user_id=UUID(user.id),
-                name=request.name,
-                category_type=request.type,
-            )
-
-    async def test_get_user_categories(self, service, user, category_repo):
-        """Testa busca de categorias do usuário."""
-        await service.create_category(
-            user_id=UUID(user.id),
-            name="Food",
-            category_type=TransactionType.EXPENSE,
+            transaction_type=TransactionType.INCOME,
+            amount=100.0,
+            description="Original",
+            date=datetime(2024, 1, 1),
         )
 
-        system_category = Category.create_system_category(
-            "Salary", TransactionType.INCOME
+        new_date = datetime(2024, 2, 1)
+        duplicated = await service.duplicate_transaction(
+            original.id, user_uuid, new_date
         )
-        await category_repo.create(system_category)
-
-        categories = await service.list_categories(UUID(user.id))
-
-        assert len(categories) == 2
-        user_categories = [c for c in categories if not c.is_system]
-        system_categories = [c for c in categories if c.is_system]
 
-        assert len(user_categories) == 1
-        assert len(system_categories) == 1
+        assert duplicated.id != original.id
+        assert duplicated.date == new_date
+        assert duplicated.amount == original.amount
+        assert duplicated.description == "Original (cópia)"
+        stored_account = await account_repo.get_by_id(account.id, user_uuid)
+        assert stored_account.balance == Decimal("200.00")
 
-    async def test_delete_category_success(self, service, user):
-        """Testa exclusão de categoria do usuário."""
-        request = CreateCategoryRequest(
-            name="To Delete", type=TransactionType.EXPENSE
-        )
-
-        category = await service.create_category(
-            user_id=UUID(user.id),
-            name=request.name,
-            category_type=request.type,
-        )
-
-        await service.delete_category(category.id, UUID(user.id))
-
-        with pytest.raises(CategoryNotFoundError):
-            await service.get_category_by_id(category.id, UUID(user.id))
-
-    async def test_delete_system_category_fails(
-        self, service, user, category_repo
+    async def test_duplicate_transaction_not_found(
+        self, service, user_uuid, now
     ):
-        """Testa que não é possível excluir categoria do sistema."""
-        category = Category.create_system_category(
-            "System Category", TransactionType.INCOME
-        )
-        await category_repo.create(category)
-
-        with pytest.raises(CannotDeleteSystemCategoryError):
-            await service.delete_category(category.id, UUID(user.id))
+        """Testa duplicação de transação inexistente."""
+        with pytest.raises(TransactionNotFoundError):
+            await service.duplicate_transaction(uuid4(), user_uuid, now)
@@ -4,145 +4,135 @@ Testes abrangentes para TransactionService - Parte 2: Update e Delete.
 
 from datetime import datetime, timedelta
 from decimal import Decimal
+from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
 import pytest
 
-from app.adapters.outbound.memory_repositories import (
-    InMemoryAccountRepository,
-    InMemoryCategoryRepository,
-    InMemoryTransactionRepository,
-)
-from app.core.domain.account import Account, AccountType
+from app.core.domain.account import AccountType
 from app.core.domain.exceptions import (
     AccountNotFoundError,
     CategoryNotFoundError,
     InvalidTransactionAmountError,
     TransactionNotFoundError,
 )
-from app.core.domain.transaction import (
-    Category,
-    RecurrenceType,
-    TransactionType,
-)
-from app.core.domain.user import User
-from app.core.services.transaction_service import TransactionServiceImpl
-
-
+from app.core.domain.transaction import RecurrenceType, TransactionType
+
+pytestmark = pytest.mark.asyncio
+
+# IDs fixos dos modelos de teste (falhas reproduzíveis).
+_ACCOUNT_ID = UUID(int=1)
+_ACCOUNT2_ID = UUID(int=2)
+_INCOME_CATEGORY_ID = UUID(int=3)
+_EXPENSE_CATEGORY_ID = UUID(int=4)
+_EXPENSE_CATEGORY2_ID = UUID(int=5)
+
+# Atualizações inválidas sobre a transação base: campos, exceção e mensagem.
+_INVALID_UPDATES = [
+    pytest.param(
+        {"account_id": uuid4()}, AccountNotFoundError, None, id="account"
+    ),
+    pytest.param(
+        {"category_id": uuid4()}, CategoryNotFoundError, None, id="category"
+    ),
+    pytest.param(
+        # Categoria de despesa sem mudar o tipo da transação de receita
+        {"category_id": _EXPENSE_CATEGORY_ID},
+        ValueError,
+        "Categoria é do tipo",
+        id="incompatible_category_type",
+    ),
+    pytest.param(
+        {"amount": 0.0}, InvalidTransactionAmountError, None, id="amount"
+    ),
+    pytest.param(
+        {"amount": 0.004},
+        InvalidTransactionAmountError,
+        None,
+        id="amount_fraction_of_cent",
+    ),
+    pytest.param(
+        {"amount": Decimal("10.005")},
+        InvalidTransactionAmountError,
+        None,
+        id="amount_three_decimals",
+    ),
+]
+
+
+@pytest.mark.usefixtures("reset_repositories")
 class TestTransactionServiceUpdateDelete:
     """Testes para update e delete de transações."""
 
     @pytest.fixture
-    def user(self):
-        """Usuário de teste."""
-        now = datetime.utcnow()
-        return User(
-            id=str(uuid4()),
-            name="Test User",
-            email="test@example.com",
-            password_hash="Hashed_password1@",
-            created_at=now,
-            updated_at=now,
-            is_active=True,
-        )
+    def account(self, make_account):
+        """Conta principal, com saldo alto para evitar negativo."""
+        return make_account(id=_ACCOUNT_ID, balance=Decimal("5000.00"))
 
     @pytest.fixture
-    def account(self, user):
-        """Conta de teste."""
-        return Account(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Test Account",
-            type=AccountType.CHECKING,
-            balance=Decimal("5000.00"),  # Saldo alto para evitar negativo
-        )
-
-    @pytest.fixture
-    def account2(self, user):
+    def account2(self, make_account):
         """Segunda conta de teste."""
-        return Account(
-            id=uuid4(),
-            user_id=UUID(user.id),
+        return make_account(
+            id=_ACCOUNT2_ID,
             name="Second Account",
             type=AccountType.SAVINGS,
             balance=Decimal("2000.00"),
         )
 
     @pytest.fixture
-    def income_category(self, user):
+    def income_category(self, make_category):
         """Categoria de receita."""
-        return Category(
-            id=uuid4(),
-            user_id=UUID(user.id),
+        return make_category(
+            id=_INCOME_CATEGORY_ID,
             name="Salary",
             type=TransactionType.INCOME,
         )
 
     @pytest.fixture
-    def expense_category(self, user):
+    def expense_category(self, make_category):
         """Categoria de despesa."""
-        return Category(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Food",
-            type=TransactionType.EXPENSE,
-        )
+        return make_category(id=_EXPENSE_CATEGORY_ID, name="Food")
 
     @pytest.fixture
-    def expense_category2(self, user):
+    def expense_category2(self, make_category):
         """Segunda categoria de despesa."""
-        return Category(
-            id=uuid4(),
-            user_id=UUID(user.id),
-            name="Transport",
-            type=TransactionType.EXPENSE,
-        )
+        return make_category(id=_EXPENSE_CATEGORY2_ID, name="Transport")
 
     @pytest.fixture
-    def transaction_repo(self):
-        """Repositório de transações em memória."""
-        return InMemoryTransactionRepository()
-
-    @pytest.fixture
-    def category_repo(self):
-        """Repositório de categorias em memória."""
-        return InMemoryCategoryRepository()
+    def seed_transaction(
+        self, service, seed, user_uuid, account, income_category, now
+    ):
+        """Semeia conta e categoria de receita e cria a transação base."""
 
-    @pytest.fixture
-    def account_repo(self):
-        """Repositório de contas em memória."""
-        return InMemoryAccountRepository()
+        async def _create(accounts=(), categories=(), **overrides):
+            await seed(
+                accounts=[account, *accounts],
+                categories=[income_category, *categories],
+            )
+            fields = {
+                "account_id": account.id,
+                "category_id": income_category.id,
+                "transaction_type": TransactionType.INCOME,
+                "amount": 500.0,
+                "description": "Test",
+                "date": now,
+            }
+            return await service.create_transaction(
+                user_id=user_uuid, **(fields | overrides)
+            )
 
-    @pytest.fixture
-    def service(self, transaction_repo, category_repo, account_repo):
-        """Serviço de transações configurado."""
-        return TransactionServiceImpl(
-            transaction_repository=transaction_repo,
-            category_repository=category_repo,
-            account_repository=account_repo,
-        )
+        return _create
 
     async def test_update_transaction_amount(
-        self, service, user, account, income_category, category_repo
+        self, service, seed_transaction, user_uuid
     ):
         """Testa atualização do valor da transação."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
         # Criar transação
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Original amount",
-            date=datetime.utcnow(),
-        )
+        transaction = await seed_transaction(description="Original amount")
 
         # Atualizar valor
         updated = await service.update_transaction(
-            transaction_id=transaction.id, user_id=UUID(user.id), amount=750.0
+            transaction_id=transaction.id, user_id=user_uuid, amount=750.0
         )
 
         assert updated.amount == Decimal("750.00")
@@ -151,56 +141,65 @@ class TestTransactionServiceUpdateDelete:
         )  # Outros campos inalterados
 
     async def test_update_transaction_description(
-        self, service, user, account, income_category, category_repo
+        self, service, seed_transaction, user_uuid
     ):
         """Testa atualização da descrição."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
         # Criar transação
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Original description",
-            date=datetime.utcnow(),
+        transaction = await seed_transaction(
+            description="Original description"
         )
 
         # Atualizar descrição
         updated = await service.update_transaction(
             transaction_id=transaction.id,
-            user_id=UUID(user.id),
+            user_id=user_uuid,
             description="Updated description",
         )
 
         assert updated.description == "Updated description"
         assert updated.amount == Decimal("500.00")  # Outros campos inalterados
 
+    async def test_update_transaction_without_changes(
+        self,
+        service,
+        seed_transaction,
+        user_uuid,
+        transaction_repo,
+        account_repo,
+        monkeypatch,
+    ):
+        """Testa que update sem alterações não grava nem recalcula saldo."""
+        transaction = await seed_transaction(description="Unchanged")
+        updated_at = transaction.updated_at
+        transaction_update = AsyncMock(wraps=transaction_repo.update)
+        account_update = AsyncMock(wraps=account_repo.update)
+        monkeypatch.setattr(transaction_repo, "update", transaction_update)
+        monkeypatch.setattr(account_repo, "update", account_update)
+
+        updated = await service.update_transaction(
+            transaction_id=transaction.id,
+            user_id=user_uuid,
+            amount=500.0,
+            description="Unchanged",
+        )
+
+        assert updated.updated_at == updated_at
+        transaction_update.assert_not_awaited()
+        account_update.assert_not_awaited()
+
     async def test_update_transaction_account(
-        self, service, user, account, account2, income_category, category_repo
+        self, service, seed_transaction, user_uuid, account2
     ):
         """Testa mudança de conta da transação."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-        await service._account_repo.create(account2)
-
         # Criar transação na primeira conta
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Test transaction",
-            date=datetime.utcnow(),
+        transaction = await seed_transaction(
+            accounts=[account2], description="Test transaction"
         )
 
         # Mover para segunda conta
         updated = await service.update_transaction(
             transaction_id=transaction.id,
-            user_id=UUID(user.id),
+            user_id=user_uuid,
             account_id=account2.id,
         )
 
@@ -209,63 +208,54 @@ class TestTransactionServiceUpdateDelete:
     async def test_update_transaction_category(
         self,
         service,
-        user,
+        seed,
+        user_uuid,
         account,
         expense_category,
         expense_category2,
-        category_repo,
+        now,
     ):
         """Testa mudança de categoria da transação."""
-        await category_repo.create(expense_category)
-        await category_repo.create(expense_category2)
-
         # Criar conta do tipo CREDIT_CARD que permite saldo negativo
         account.type = AccountType.CREDIT_CARD
-        await service._account_repo.create(account)
+        await seed(
+            accounts=[account],
+            categories=[expense_category, expense_category2],
+        )
 
         # Criar transação
         transaction = await service.create_transaction(
-            user_id=UUID(user.id),
+            user_id=user_uuid,
             account_id=account.id,
             category_id=expense_category.id,
             transaction_type=TransactionType.EXPENSE,
             amount=100.0,
             description="Test expense",
-            date=datetime.utcnow(),
+            date=now,
         )
 
         # Mudar categoria
         updated = await service.update_transaction(
             transaction_id=transaction.id,
-            user_id=UUID(user.id),
+            user_id=user_uuid,
             category_id=expense_category2.id,
         )
 
         assert updated.category_id == expense_category2.id
 
     async def test_update_transaction_make_recurring(
-        self, service, user, account, income_category, category_repo
+        self, service, seed_transaction, user_uuid
     ):
         """Testa transformar transação em recorrente."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
         # Criar transação não recorrente
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=2000.0,
-            description="Salary",
-            date=datetime.utcnow(),
-            is_recurring=False,
+        transaction = await seed_transaction(
+            amount=2000.0, description="Salary"
         )
 
         # Tornar recorrente
         updated = await service.update_transaction(
             transaction_id=transaction.id,
-            user_id=UUID(user.id),
+            user_id=user_uuid,
             is_recurring=True,
             recurrence_frequency=RecurrenceType.MONTHLY.value,
         )
@@ -274,183 +264,101 @@ class TestTransactionServiceUpdateDelete:
         assert updated.recurrence_frequency == RecurrenceType.MONTHLY
 
     async def test_update_transaction_change_date(
-        self, service, user, account, income_category, category_repo
+        self, service, seed_transaction, user_uuid, transaction_repo, now
     ):
         """Testa mudança da data da transação."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
         original_date = datetime(2024, 1, 1)
         # Data mais próxima para evitar erro de validação
-        new_date = datetime.utcnow() - timedelta(days=5)
+        new_date = now - timedelta(days=5)
 
         # Criar transação
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Test",
-            date=original_date,
-        )
+        transaction = await seed_transaction(date=original_date)
 
         # Atualizar data
         updated = await service.update_transaction(
-            transaction_id=transaction.id, user_id=UUID(user.id), date=new_date
+            transaction_id=transaction.id, user_id=user_uuid, date=new_date
         )
 
         assert updated.date == new_date
 
-    # TESTES DE VALIDAÇÃO DE UPDATE
-
-    async def test_update_transaction_not_found(self, service, user):
-        """Testa erro ao atualizar transação inexistente."""
-        with pytest.raises(TransactionNotFoundError):
-            await service.update_transaction(
-                transaction_id=uuid4(), user_id=UUID(user.id), amount=100.0
-            )
+        # Consulta por período deve refletir a nova data
+        old_period = await transaction_repo.get_by_user_and_period(
+            user_uuid, datetime(2024, 1, 1), datetime(2024, 1, 31)
+        )
+        new_period = await transaction_repo.get_by_user_and_period(
+            user_uuid, new_date - timedelta(days=1), now
+        )
+        assert old_period == []
+        assert [t.id for t in new_period] == [transaction.id]
 
-    async def test_update_transaction_invalid_account(
-        self, service, user, account, income_category, category_repo
+    async def test_failed_update_keeps_stored_transaction(
+        self, service, seed_transaction, user_uuid, transaction_repo, now
     ):
-        """Testa erro ao mover para conta inexistente."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
-        # Criar transação
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Test",
-            date=datetime.utcnow(),
-        )
+        """Testa que update rejeitado não altera a transação armazenada."""
+        original_date = datetime(2024, 1, 1)
+        transaction = await seed_transaction(date=original_date)
 
-        # Tentar mover para conta inexistente
-        with pytest.raises(AccountNotFoundError):
+        with pytest.raises(ValueError, match="Frequência inválida"):
             await service.update_transaction(
                 transaction_id=transaction.id,
-                user_id=UUID(user.id),
-                account_id=uuid4(),  # Conta inexistente
+                user_id=user_uuid,
+                date=now - timedelta(days=5),
+                is_recurring=True,
+                recurrence_frequency="hourly",
             )
 
-    async def test_update_transaction_invalid_category(
-        self, service, user, account, income_category, category_repo
-    ):
-        """Testa erro ao mudar para categoria inexistente."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
-        # Criar transação
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Test",
-            date=datetime.utcnow(),
+        stored = await transaction_repo.get_by_id(transaction.id, user_uuid)
+        assert stored.date == original_date
+        old_period = await transaction_repo.get_by_user_and_period(
+            user_uuid, datetime(2024, 1, 1), datetime(2024, 1, 31)
         )
+        assert [t.id for t in old_period] == [transaction.id]
+
+    # TESTES DE VALIDAÇÃO DE UPDATE
 
-        # Tentar mudar para categoria inexistente
-        with pytest.raises(CategoryNotFoundError):
+    async def test_update_transaction_not_found(self, service, user_uuid):
+        """Testa erro ao atualizar transação inexistente."""
+        with pytest.raises(TransactionNotFoundError):
             await service.update_transaction(
-                transaction_id=transaction.id,
-                user_id=UUID(user.id),
-                category_id=uuid4(),  # Categoria inexistente
+                transaction_id=uuid4(), user_id=user_uuid, amount=100.0
             )
 
-    async def test_update_transaction_incompatible_category_type(
+    @pytest.mark.parametrize("changes,expected_exc,match", _INVALID_UPDATES)
+    async def test_update_transaction_invalid(
         self,
         service,
-        user,
-        account,
-        income_category,
+        seed_transaction,
+        user_uuid,
         expense_category,
-        category_repo,
+        changes,
+        expected_exc,
+        match,
     ):
-        """Testa erro ao mudar para categoria de tipo incompatível."""
-        await category_repo.create(income_category)
-        await category_repo.create(expense_category)
-        await service._account_repo.create(account)
-
-        # Criar transação de receita
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Income",
-            date=datetime.utcnow(),
-        )
+        """Testa erros de validação ao atualizar transação existente."""
+        transaction = await seed_transaction(categories=[expense_category])
 
-        # Tentar mudar para categoria de despesa sem mudar o tipo
-        with pytest.raises(ValueError, match="Categoria é do tipo"):
+        with pytest.raises(expected_exc, match=match):
             await service.update_transaction(
-                transaction_id=transaction.id,
-                user_id=UUID(user.id),
-                category_id=expense_category.id,
-                # Sem mudar transaction_type
-            )
-
-    async def test_update_transaction_invalid_amount(
-        self, service, user, account, income_category, category_repo
-    ):
-        """Testa erro ao atualizar com valor inválido."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
-        # Criar transação
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="Test",
-            date=datetime.utcnow(),
-        )
-
-        # Tentar atualizar com valor inválido
-        with pytest.raises(InvalidTransactionAmountError):
-            await service.update_transaction(
-                transaction_id=transaction.id,
-                user_id=UUID(user.id),
-                amount=0.0,  # Valor inválido
+                transaction_id=transaction.id, user_id=user_uuid, **changes
             )
 
     # TESTES DE DELETE
 
     async def test_delete_transaction_success(
-        self, service, user, account, income_category, category_repo
+        self, service, seed_transaction, user_uuid
     ):
         """Testa exclusão bem-sucedida de transação."""
-        await category_repo.create(income_category)
-        await service._account_repo.create(account)
-
         # Criar transação
-        transaction = await service.create_transaction(
-            user_id=UUID(user.id),
-            account_id=account.id,
-            category_id=income_category.id,
-            transaction_type=TransactionType.INCOME,
-            amount=500.0,
-            description="To be deleted",
-            date=datetime.utcnow(),
-        )
+        transaction = await seed_transaction(description="To be deleted")
 
         # Deletar
-        await service.delete_transaction(transaction.id, UUID(user.id))
+        await service.delete_transaction(transaction.id, user_uuid)
 
         # Verificar que foi deletada
         with pytest.raises(TransactionNotFoundError):
-            await service.get_transaction_by_id(transaction.id, UUID(user.id))
+            await service.get_transaction_by_id(transaction.id, user_uuid)
 
-    async def test_delete_transaction_not_found(self, service, user):
+    async def test_delete_transaction_not_found(self, service, user_uuid):
         """Testa erro ao deletar transação inexistente."""
         with pytest.raises(TransactionNotFoundError):
-            await service.delete_transaction(uuid4(), UUID(user.id))
+            await service.delete_transaction(uuid4(), user_uuid)